@@ -1,25 +1,259 @@
-from fastapi import APIRouter, HTTPException
-from app.schemas.summary import SummaryRequest, SummaryResponse
-from app.services.summarizer_service import summarize_text, extract_keywords
+import asyncio
+import itertools
+import json
+from typing import Optional
+from fastapi import APIRouter, File, Form, HTTPException, Response, UploadFile
+from fastapi.concurrency import iterate_in_threadpool, run_in_threadpool
+from fastapi.responses import StreamingResponse
+from app.schemas.job import JobCreated, JobStatus
+from app.schemas.summary import BatchSummaryRequest, SummaryRequest, SummaryResponse
+from app.services import batch_service, job_service, pdf_service
+from app.services.summarizer_service import summarize_document
+from app.services.engines import ENGINE_CHOICES
+from app.services.keyword_service import KEYWORD_ENGINES
 
 router = APIRouter()
 
+# How often the job event stream checks for progress, in seconds
+JOB_EVENT_POLL_INTERVAL = 0.5
+
+
+def _validate_options(engine: Optional[str], mode: str, keyword_engine: Optional[str]) -> None:
+    if engine and engine not in ENGINE_CHOICES:
+        raise HTTPException(status_code=400, detail=f"Unknown engine: {engine}")
+    if mode not in ("concat", "mapreduce"):
+        raise HTTPException(status_code=400, detail=f"Unknown mode: {mode}")
+    if keyword_engine and keyword_engine not in KEYWORD_ENGINES:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown keyword engine: {keyword_engine}"
+        )
+
+
+def _validate(req: SummaryRequest) -> None:
+    if not req.text or not req.text.strip():
+        raise HTTPException(status_code=400, detail="Input text cannot be empty.")
+    _validate_options(req.engine, req.mode, req.keyword_engine)
+
+
+def _set_cache_headers(response: Response, cache: dict) -> None:
+    response.headers["X-Cache-Summary"] = "HIT" if cache["summary"] else "MISS"
+    response.headers["X-Cache-Keywords"] = "HIT" if cache["keywords"] else "MISS"
+
 
 @router.post("/summarize", response_model=SummaryResponse)
-async def summarize(req: SummaryRequest) -> SummaryResponse:
+async def summarize(req: SummaryRequest, response: Response) -> SummaryResponse:
     """
     Endpoint to receive text and return a summary and keywords.
     """
-    if not req.text or not req.text.strip():
-        raise HTTPException(status_code=400, detail="Input text cannot be empty.")
+    _validate(req)
 
     try:
         print(f"Request received to process text with summary length: {req.summary_length}")
-        summary = summarize_text(req.text, req.summary_length)
-        keywords = extract_keywords(req.text)
-        return SummaryResponse(summary=summary, keywords=keywords)
+        # Inference blocks, so keep it off the event loop
+        result = await run_in_threadpool(
+            summarize_document,
+            req.text,
+            req.summary_length,
+            req.engine,
+            req.mode,
+            keyword_engine=req.keyword_engine,
+            latency_budget_ms=req.latency_budget_ms,
+        )
+        _set_cache_headers(response, result.pop("cache"))
+        return SummaryResponse(**result)
     except Exception as e:
         # Log the exception here if logging is set up
         raise HTTPException(
             status_code=500, detail=f"An error occurred during processing: {e}"
-        )
\ No newline at end of file
+        )
+
+
+async def _summary_events(req: SummaryRequest):
+    """
+    Runs the summarization in a worker thread and relays each chunk summary
+    as it is produced, followed by a final event with the keywords.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def on_chunk(index: int, total: int, summary: str) -> None:
+        event = {"index": index, "chunks_total": total, "summary": summary}
+        loop.call_soon_threadsafe(queue.put_nowait, event)
+
+    task = loop.run_in_executor(
+        None,
+        lambda: summarize_document(
+            req.text,
+            req.summary_length,
+            req.engine,
+            req.mode,
+            keyword_engine=req.keyword_engine,
+            on_chunk=on_chunk,
+            latency_budget_ms=req.latency_budget_ms,
+        ),
+    )
+    # Wake the loop below once the work finishes so it can drain the queue
+    task.add_done_callback(lambda _: queue.put_nowait(None))
+
+    while True:
+        event = await queue.get()
+        if event is None:
+            break
+        yield f"data: {json.dumps(event)}\n\n"
+
+    try:
+        result = task.result()
+    except Exception as e:
+        yield f"data: {json.dumps({'error': f'An error occurred during processing: {e}'})}\n\n"
+        return
+
+    result.pop("cache")
+    yield f"data: {json.dumps(dict(result, done=True))}\n\n"
+
+
+@router.post("/summarize/stream")
+async def summarize_stream(req: SummaryRequest):
+    """
+    Server-sent events: one event per chunk summary as soon as it is ready,
+    then a final event with the full summary and keywords.
+    """
+    _validate(req)
+    return StreamingResponse(_summary_events(req), media_type="text/event-stream")
+
+
+def _summarize_pdf(
+    path: str, summary_length: str, engine: Optional[str], mode: str, keyword_engine: Optional[str]
+) -> dict:
+    # Pages stay separate strings; the chunker consumes them one at a time
+    pages = [page for page in pdf_service.iter_pdf_pages(path) if page.strip()]
+    if not pages:
+        raise ValueError("No extractable text found in the PDF.")
+    return summarize_document(
+        pages, summary_length, engine, mode, keyword_engine=keyword_engine
+    )
+
+
+@router.post("/summarize/pdf", response_model=SummaryResponse)
+async def summarize_pdf(
+    response: Response,
+    file: UploadFile = File(...),
+    summary_length: str = Form("medium"),
+    engine: Optional[str] = Form(None),
+    mode: str = Form("concat"),
+    keyword_engine: Optional[str] = Form(None),
+) -> SummaryResponse:
+    """
+    Accepts a PDF upload, extracts its pages on the server and returns a
+    summary and keywords.
+    """
+    _validate_options(engine, mode, keyword_engine)
+
+    upload_dir = pdf_service.make_upload_dir()
+    try:
+        try:
+            path = await pdf_service.spool_upload(file, upload_dir)
+        except pdf_service.UploadTooLarge as e:
+            raise HTTPException(status_code=413, detail=str(e))
+
+        try:
+            result = await run_in_threadpool(
+                _summarize_pdf, path, summary_length, engine, mode, keyword_engine
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"An error occurred during processing: {e}"
+            )
+    finally:
+        pdf_service.remove_upload_dir(upload_dir)
+
+    _set_cache_headers(response, result.pop("cache"))
+    return SummaryResponse(**result)
+
+
+@router.post("/summarize/batch")
+async def summarize_batch(req: BatchSummaryRequest):
+    """
+    Summarizes many documents, pooling their chunks into shared inference
+    batches. Streams one JSON line per document; failed documents get an
+    "error" line instead of failing the batch.
+    """
+    _validate_options(req.engine, "concat", req.keyword_engine)
+    if not req.documents and not req.path:
+        raise HTTPException(status_code=400, detail="Provide documents or a path.")
+
+    documents = [
+        batch_service.BatchDocument(doc.id or str(index), pages=[doc.text])
+        for index, doc in enumerate(req.documents)
+    ]
+    if req.path:
+        try:
+            path = batch_service.resolve_batch_path(req.path)
+        except PermissionError as e:
+            raise HTTPException(status_code=403, detail=str(e))
+        except FileNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        documents = itertools.chain(documents, batch_service.iter_path_documents(path))
+
+    results = batch_service.summarize_batch(
+        documents, req.summary_length, req.engine, req.keyword_engine
+    )
+
+    async def lines():
+        async for result in iterate_in_threadpool(results):
+            yield json.dumps(result) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.post("/jobs", response_model=JobCreated, status_code=202)
+async def create_job(req: SummaryRequest) -> JobCreated:
+    """
+    Queues a summarization job and returns its id without waiting for it.
+    """
+    _validate(req)
+    job = job_service.submit_job(
+        req.text,
+        req.summary_length,
+        req.engine,
+        req.mode,
+        req.keyword_engine,
+        req.latency_budget_ms,
+    )
+    return JobCreated(job_id=job.job_id, status=job.status)
+
+
+@router.get("/jobs/{job_id}", response_model=JobStatus)
+async def get_job(job_id: str) -> JobStatus:
+    """
+    Reports a job's progress and, once completed, its result.
+    """
+    job = job_service.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    return JobStatus(**job.to_dict())
+
+
+async def _job_events(job: job_service.Job):
+    last_version = -1
+    while True:
+        state = job_service.snapshot(job)
+        version = state.pop("version")
+        if version != last_version:
+            last_version = version
+            yield f"data: {json.dumps(state)}\n\n"
+        if state["status"] in (job_service.COMPLETED, job_service.FAILED):
+            break
+        await asyncio.sleep(JOB_EVENT_POLL_INTERVAL)
+
+
+@router.get("/jobs/{job_id}/events")
+async def job_events(job_id: str):
+    """
+    Server-sent events with the job state each time it changes.
+    """
+    job = job_service.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    return StreamingResponse(_job_events(job), media_type="text/event-stream")
@@ -0,0 +1,113 @@
+import os
+
+# Summarization model
+SUMMARY_MODEL = os.getenv("SUMMARY_MODEL", "facebook/bart-large-cnn")
+
+# Number of chunks sent through the pipeline in a single forward pass
+SUMMARY_BATCH_SIZE = int(os.getenv("SUMMARY_BATCH_SIZE", "8"))
+
+# Bounds on the generated summary length per chunk, in tokens
+SUMMARY_MAX_LENGTH = int(os.getenv("SUMMARY_MAX_LENGTH", "400"))
+SUMMARY_MIN_LENGTH = int(os.getenv("SUMMARY_MIN_LENGTH", "30"))
+
+# Generation lengths are rounded down to this step so that chunks of similar
+# size share a batch
+LENGTH_BUCKET = int(os.getenv("SUMMARY_LENGTH_BUCKET", "10"))
+
+# Chunking: token budget per chunk (capped at the model's input limit) and
+# the number of trailing tokens repeated at the start of the next chunk
+CHUNK_MAX_TOKENS = int(os.getenv("CHUNK_MAX_TOKENS", "1000"))
+CHUNK_OVERLAP_TOKENS = int(os.getenv("CHUNK_OVERLAP_TOKENS", "0"))
+
+# Chunks past this fill ratio may end at a content-defined anchor sentence,
+# which keeps chunk boundaries stable across document edits (1.0 disables)
+CHUNK_ANCHOR_MIN_FILL = float(os.getenv("CHUNK_ANCHOR_MIN_FILL", "0.9"))
+
+# Load the models and run one inference when the server starts, instead of
+# on the first request
+WARM_UP_ON_STARTUP = os.getenv("WARM_UP_ON_STARTUP", "true").lower() in ("1", "true", "yes")
+
+# Inference engine: "pytorch" (fp32), "int8" (dynamic quantization) or "onnx"
+SUMMARY_ENGINE = os.getenv("SUMMARY_ENGINE", "pytorch")
+
+# Where exported ONNX models are kept between restarts
+ONNX_MODEL_DIR = os.getenv("ONNX_MODEL_DIR", "onnx_models")
+
+# Map-reduce mode: worker processes (each holds its own model copy) and the
+# torch threads pinned per worker
+MAPREDUCE_WORKERS = int(os.getenv("MAPREDUCE_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+MAPREDUCE_THREADS_PER_WORKER = int(
+    os.getenv(
+        "MAPREDUCE_THREADS_PER_WORKER",
+        str(max(1, (os.cpu_count() or 1) // MAPREDUCE_WORKERS)),
+    )
+)
+
+# Map-reduce mode: reduce until the summary is within this many tokens
+SUMMARY_TARGET_TOKENS = {
+    "short": int(os.getenv("SUMMARY_TARGET_TOKENS_SHORT", "150")),
+    "medium": int(os.getenv("SUMMARY_TARGET_TOKENS_MEDIUM", "300")),
+    "long": int(os.getenv("SUMMARY_TARGET_TOKENS_LONG", "600")),
+}
+MAPREDUCE_MAX_ROUNDS = int(os.getenv("MAPREDUCE_MAX_ROUNDS", "5"))
+
+# Background summarization jobs: concurrent jobs and how long finished jobs
+# stay queryable
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_TTL_SECONDS = int(os.getenv("JOB_TTL_SECONDS", "3600"))
+
+# Persistent result cache (SQLite, size-bounded LRU)
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+CACHE_PATH = os.getenv("CACHE_PATH", os.path.join("cache", "summaries.sqlite3"))
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+CHUNK_CACHE_MAX_BYTES = int(os.getenv("CHUNK_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# Bump to invalidate cached results after changing generation behaviour
+CACHE_VERSION = os.getenv("CACHE_VERSION", "3")
+
+# Keyword extraction: "yake" (default) or "tfidf" (vectorized, for very
+# large texts); TF-IDF counts chunks of KEYWORD_CHUNK_CHARS in a pool of
+# KEYWORD_WORKERS processes once the text exceeds KEYWORD_PARALLEL_MIN_CHARS
+KEYWORD_ENGINE = os.getenv("KEYWORD_ENGINE", "yake")
+KEYWORD_TOP = int(os.getenv("KEYWORD_TOP", "10"))
+KEYWORD_WORKERS = int(os.getenv("KEYWORD_WORKERS", "2"))
+KEYWORD_CHUNK_CHARS = int(os.getenv("KEYWORD_CHUNK_CHARS", "20000"))
+KEYWORD_PARALLEL_MIN_CHARS = int(os.getenv("KEYWORD_PARALLEL_MIN_CHARS", "500000"))
+
+# PDF uploads: size limit, spool buffer, and parallel page extraction
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(200 * 1024 * 1024)))
+UPLOAD_CHUNK_BYTES = int(os.getenv("UPLOAD_CHUNK_BYTES", str(1024 * 1024)))
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", "2"))
+PDF_PAGES_PER_TASK = int(os.getenv("PDF_PAGES_PER_TASK", "16"))
+
+# Batch summarization: documents whose chunks share inference batches, and
+# the only directory that batch requests may read local files from
+BATCH_DOCS_PER_WAVE = int(os.getenv("BATCH_DOCS_PER_WAVE", "32"))
+BATCH_ROOT_DIR = os.getenv("BATCH_ROOT_DIR", "")
+
+# Micro-batching (opt-in): chunks from concurrent requests are collected for
+# up to INFERENCE_MAX_WAIT_MS (or INFERENCE_MAX_BATCH chunks) and run
+# together in place of per-request SUMMARY_BATCH_SIZE batches
+SCHEDULER_ENABLED = os.getenv("SCHEDULER_ENABLED", "false").lower() in ("1", "true", "yes")
+INFERENCE_MAX_WAIT_MS = float(os.getenv("INFERENCE_MAX_WAIT_MS", "10"))
+INFERENCE_MAX_BATCH = int(os.getenv("INFERENCE_MAX_BATCH", "16"))
+
+# Extractive engine: TextRank over at most this many sentences (centroid
+# scoring beyond that) and the vocabulary kept for the similarity matrix
+TEXTRANK_MAX_SENTENCES = int(os.getenv("TEXTRANK_MAX_SENTENCES", "1500"))
+TEXTRANK_MAX_TERMS = int(os.getenv("TEXTRANK_MAX_TERMS", "4000"))
+
+# engine="auto": go extractive above this many words, or when the estimated
+# abstractive time exceeds the request's latency budget
+EXTRACTIVE_AUTO_MIN_WORDS = int(os.getenv("EXTRACTIVE_AUTO_MIN_WORDS", "50000"))
+ABSTRACTIVE_SECONDS_PER_CHUNK = float(os.getenv("ABSTRACTIVE_SECONDS_PER_CHUNK", "2.0"))
+
+# Cleaning before summarization: drop lines that repeat in the first/last
+# CLEAN_EDGE_LINES lines (headers, footers) or anywhere (boilerplate) on at
+# least CLEAN_REPEAT_MIN_FRACTION of the pages, and paragraphs of at least
+# CLEAN_MIN_PARAGRAPH_WORDS words that nearly duplicate an earlier one
+CLEAN_ENABLED = os.getenv("CLEAN_ENABLED", "true").lower() in ("1", "true", "yes")
+CLEAN_EDGE_LINES = int(os.getenv("CLEAN_EDGE_LINES", "3"))
+CLEAN_REPEAT_MIN_FRACTION = float(os.getenv("CLEAN_REPEAT_MIN_FRACTION", "0.5"))
+CLEAN_MIN_PARAGRAPH_WORDS = int(os.getenv("CLEAN_MIN_PARAGRAPH_WORDS", "8"))
+CLEAN_NEAR_DUP_SIMILARITY = float(os.getenv("CLEAN_NEAR_DUP_SIMILARITY", "0.9"))
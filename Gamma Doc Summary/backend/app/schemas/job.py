@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from typing import Optional
+from app.schemas.summary import SummaryResponse
+
+
+class JobCreated(BaseModel):
+    job_id: str
+    status: str
+
+
+class JobStatus(BaseModel):
+    job_id: str
+    status: str
+    chunks_done: int = 0
+    chunks_total: int = 0
+    result: Optional[SummaryResponse] = None
+    error: Optional[str] = None
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Optional
 
 
 class SummaryRequest(BaseModel):
@@ -7,8 +7,47 @@ class SummaryRequest(BaseModel):
     summary_length: str = Field(
         "medium", description="Desired summary length: short, medium, or long"
     )
+    engine: Optional[str] = Field(
+        None,
+        description="Inference engine: pytorch, int8 or onnx; extractive to pick sentences "
+        "without the model; auto to choose per document (server default if omitted)",
+    )
+    latency_budget_ms: Optional[int] = Field(
+        None, description="With engine=auto, go extractive if abstractive would take longer"
+    )
+    mode: str = Field(
+        "concat",
+        description="concat: join chunk summaries; mapreduce: summarize in parallel and reduce to fit the length",
+    )
+    keyword_engine: Optional[str] = Field(
+        None, description="Keyword engine: yake, or tfidf for very large texts (server default if omitted)"
+    )
 
 
 class SummaryResponse(BaseModel):
     summary: str
-    keywords: List[str]
\ No newline at end of file
+    keywords: List[str]
+    chunks_total: int = 0
+    chunks_reused: int = Field(
+        0, description="Chunks whose summaries were reused from earlier documents"
+    )
+    tokens_removed: int = Field(
+        0, description="Model tokens of repeated headers, footers and duplicate text dropped before summarizing"
+    )
+
+
+class BatchDocumentIn(BaseModel):
+    id: Optional[str] = None
+    text: str
+
+
+class BatchSummaryRequest(BaseModel):
+    documents: List[BatchDocumentIn] = []
+    path: Optional[str] = Field(
+        None, description="Directory or zip file under the server's BATCH_ROOT_DIR"
+    )
+    summary_length: str = Field(
+        "medium", description="Desired summary length: short, medium, or long"
+    )
+    engine: Optional[str] = None
+    keyword_engine: Optional[str] = None
@@ -0,0 +1,216 @@
+import os
+import zipfile
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional
+from app.core import config
+from app.services import pdf_service
+from app.services import summarizer_service as summarizer
+from app.services.cache_service import get_result_cache, text_hash
+from app.services.engines import AUTO, EXTRACTIVE
+from app.services.extractive_service import summarize_extractive, target_words
+
+SUPPORTED_EXTENSIONS = (".txt", ".md", ".pdf")
+
+
+@dataclass
+class BatchDocument:
+    doc_id: str
+    pages: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def resolve_batch_path(path: str) -> str:
+    """
+    Resolves a directory or zip path, refusing anything outside BATCH_ROOT_DIR.
+    """
+    if not config.BATCH_ROOT_DIR:
+        raise PermissionError("Local batch paths are disabled; set BATCH_ROOT_DIR to enable them.")
+    root = os.path.realpath(config.BATCH_ROOT_DIR)
+    resolved = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath([root, resolved]) != root:
+        raise PermissionError(f"Path is outside the batch root: {path}")
+    if not os.path.exists(resolved):
+        raise FileNotFoundError(f"No such file or directory: {path}")
+    return resolved
+
+
+def _read_pages(name: str, data: bytes) -> List[str]:
+    if name.lower().endswith(".pdf"):
+        return pdf_service.extract_pdf_bytes(data)
+    return [data.decode("utf-8", errors="replace")]
+
+
+def _load(doc_id: str, read) -> BatchDocument:
+    try:
+        return BatchDocument(doc_id, pages=_read_pages(doc_id, read()))
+    except Exception as e:
+        return BatchDocument(doc_id, error=f"Could not read document: {e}")
+
+
+def iter_path_documents(path: str) -> Iterator[BatchDocument]:
+    """
+    Yields the supported files of a directory (recursively) or zip archive.
+    """
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for name in sorted(archive.namelist()):
+                if name.lower().endswith(SUPPORTED_EXTENSIONS):
+                    yield _load(name, lambda: archive.read(name))
+        return
+
+    for directory, _, files in sorted(os.walk(path)):
+        for name in sorted(files):
+            if name.lower().endswith(SUPPORTED_EXTENSIONS):
+                full_path = os.path.join(directory, name)
+
+                def read(full_path=full_path):
+                    with open(full_path, "rb") as f:
+                        return f.read()
+
+                yield _load(os.path.relpath(full_path, path), read)
+
+
+def _summarize_wave(
+    documents: List[BatchDocument],
+    summary_length: str,
+    engine: Optional[str],
+    keyword_engine: Optional[str],
+) -> Iterator[Dict[str, object]]:
+    """
+    Summarizes a group of documents with their chunks pooled into shared
+    inference batches. Failures are reported per document.
+    """
+    cache = get_result_cache()
+    ratios = summarizer.get_length_ratios(summary_length)
+    results: Dict[int, Dict[str, object]] = {}
+    pending = []  # (position, document, key, chunks, keywords_future, tokens_removed)
+
+    for position, doc in enumerate(documents):
+        if doc.error:
+            results[position] = {"id": doc.doc_id, "error": doc.error}
+            continue
+        if not any(page.strip() for page in doc.pages):
+            results[position] = {"id": doc.doc_id, "error": "Document has no text."}
+            continue
+
+        digest = text_hash(doc.pages) if cache else None
+        try:
+            cleaned = summarizer.clean_document(doc.pages)
+        except Exception as e:
+            results[position] = {"id": doc.doc_id, "error": f"Cleaning failed: {e}"}
+            continue
+        pages = cleaned.pages
+
+        doc_engine = engine
+        if engine == AUTO:
+            doc_engine = summarizer.choose_engine(pages, summary_length)
+
+        keywords_future = summarizer.submit_keywords(pages, keyword_engine, digest)
+        key = summarizer.summary_cache_key(digest, summary_length, "concat", doc_engine)
+        cached = cache.get(key) if cache else None
+        if cached is not None:
+            results[position] = {
+                "id": doc.doc_id,
+                "summary": cached["summary"],
+                "chunks_total": cached["chunks_total"],
+                "tokens_removed": cached.get("tokens_removed", 0),
+                "keywords_future": keywords_future,
+            }
+            continue
+
+        if doc_engine == EXTRACTIVE:
+            # No model work, so there is nothing to pool
+            try:
+                summary = summarize_extractive(pages, target_words(summary_length))
+            except Exception as e:
+                results[position] = {"id": doc.doc_id, "error": f"Summarization failed: {e}"}
+                continue
+            if cache:
+                cache.put(
+                    key, {"summary": summary, "chunks_total": 0, "tokens_removed": cleaned.tokens_removed}
+                )
+            results[position] = {
+                "id": doc.doc_id,
+                "summary": summary,
+                "chunks_total": 0,
+                "tokens_removed": cleaned.tokens_removed,
+                "keywords_future": keywords_future,
+            }
+            continue
+
+        try:
+            chunks = summarizer.make_chunks(summarizer.iter_sentences(pages))
+        except Exception as e:
+            results[position] = {"id": doc.doc_id, "error": f"Chunking failed: {e}"}
+            continue
+        pending.append((position, doc, key, chunks, keywords_future, cleaned.tokens_removed))
+
+    # One pooled pass over every chunk in the wave; if it fails, fall back to
+    # one pass per document so a single bad input cannot sink the others
+    all_chunks = [chunk for _, _, _, chunks, _, _ in pending for chunk in chunks]
+    # Documents left here under "auto" resolved to the default model engine
+    if engine == AUTO:
+        engine = None
+    try:
+        pooled = summarizer.summarize_chunks(all_chunks, ratios, engine=engine)
+        per_document = []
+        offset = 0
+        for _, _, _, chunks, _, _ in pending:
+            per_document.append(pooled[offset : offset + len(chunks)])
+            offset += len(chunks)
+    except Exception:
+        per_document = []
+        for _, _, _, chunks, _, _ in pending:
+            try:
+                per_document.append(summarizer.summarize_chunks(chunks, ratios, engine=engine))
+            except Exception as e:
+                per_document.append(e)
+
+    for (position, doc, key, chunks, keywords_future, tokens_removed), parts in zip(
+        pending, per_document
+    ):
+        if isinstance(parts, Exception):
+            results[position] = {"id": doc.doc_id, "error": f"Summarization failed: {parts}"}
+            continue
+        summary = " ".join(part for part in parts if part).strip()
+        if cache:
+            cache.put(
+                key, {"summary": summary, "chunks_total": len(chunks), "tokens_removed": tokens_removed}
+            )
+        results[position] = {
+            "id": doc.doc_id,
+            "summary": summary,
+            "chunks_total": len(chunks),
+            "tokens_removed": tokens_removed,
+            "keywords_future": keywords_future,
+        }
+
+    for position in range(len(documents)):
+        result = results[position]
+        keywords_future = result.pop("keywords_future", None)
+        if keywords_future is not None:
+            try:
+                result["keywords"], _ = keywords_future.result()
+            except Exception as e:
+                result = {"id": result["id"], "error": f"Keyword extraction failed: {e}"}
+        yield result
+
+
+def summarize_batch(
+    documents: Iterable[BatchDocument],
+    summary_length: str = "medium",
+    engine: Optional[str] = None,
+    keyword_engine: Optional[str] = None,
+) -> Iterator[Dict[str, object]]:
+    """
+    Yields one result per document, in input order, processing documents in
+    waves of BATCH_DOCS_PER_WAVE so output starts before the batch ends.
+    """
+    wave: List[BatchDocument] = []
+    for doc in documents:
+        wave.append(doc)
+        if len(wave) >= config.BATCH_DOCS_PER_WAVE:
+            yield from _summarize_wave(wave, summary_length, engine, keyword_engine)
+            wave = []
+    if wave:
+        yield from _summarize_wave(wave, summary_length, engine, keyword_engine)
@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, Optional, Union
+from app.core import config
+from app.services.cleaning_service import PAGE_BREAK
+
+_SPACES = re.compile(r"[ \t]+")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Collapses runs of spaces and tabs and trims each line, so re-extracted
+    copies of a document hash the same. Line and page breaks are kept:
+    cleaning and chunking depend on them.
+    """
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(_SPACES.sub(" ", line).strip(" ") for line in lines)
+
+
+def text_hash(text: Union[str, Iterable[str]]) -> str:
+    """
+    Hashes the normalized text. A sequence of pages hashes the same as the
+    pages joined with page breaks, without building the joined string.
+    """
+    pages = [text] if isinstance(text, str) else text
+    digest = hashlib.sha256()
+    separator = b""
+    for page in pages:
+        digest.update(separator + normalize_text(page).encode("utf-8"))
+        separator = PAGE_BREAK.encode("utf-8")
+    return digest.hexdigest()
+
+
+def make_key(*parts: Any) -> str:
+    """
+    Builds a cache key from its parts, e.g. make_key("summary", digest, "short").
+    """
+    return hashlib.sha256("\x1f".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+
+class SqliteLRUCache:
+    """
+    JSON values in a SQLite table, evicted least-recently-used first once
+    the stored values exceed max_bytes.
+    """
+
+    def __init__(self, path: str, max_bytes: int, table: str = "entries"):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.table = table
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "size INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_lru ON {table} (last_access)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock, self._connect() as conn:
+            row = conn.execute(f"SELECT value FROM {self.table} WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                f"UPDATE {self.table} SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        data = json.dumps(value)
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, size, last_access) VALUES (?, ?, ?, ?)",
+                (key, data, len(data), time.time()),
+            )
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.table}").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        expired = []
+        for key, size in conn.execute(f"SELECT key, size FROM {self.table} ORDER BY last_access"):
+            if total <= self.max_bytes:
+                break
+            expired.append((key,))
+            total -= size
+        conn.executemany(f"DELETE FROM {self.table} WHERE key = ?", expired)
+
+
+_result_cache: Optional[SqliteLRUCache] = None
+_chunk_cache: Optional[SqliteLRUCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> Optional[SqliteLRUCache]:
+    """
+    Returns the document-level result cache, or None when caching is disabled.
+    """
+    global _result_cache
+    if not config.CACHE_ENABLED:
+        return None
+    if _result_cache is None:
+        with _cache_lock:
+            if _result_cache is None:
+                _result_cache = SqliteLRUCache(config.CACHE_PATH, config.CACHE_MAX_BYTES)
+    return _result_cache
+
+
+def get_chunk_cache() -> Optional[SqliteLRUCache]:
+    """
+    Returns the per-chunk summary cache, or None when caching is disabled.
+    """
+    global _chunk_cache
+    if not config.CACHE_ENABLED:
+        return None
+    if _chunk_cache is None:
+        with _cache_lock:
+            if _chunk_cache is None:
+                _chunk_cache = SqliteLRUCache(config.CACHE_PATH, config.CHUNK_CACHE_MAX_BYTES, table="chunks")
+    return _chunk_cache
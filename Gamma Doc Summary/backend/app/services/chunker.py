@@ -0,0 +1,128 @@
+import re
+import zlib
+from typing import Iterable, Iterator, List, Tuple
+
+# Sentence boundary: terminal punctuation followed by whitespace, or a blank line
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+|\n\s*\n")
+
+# Roughly one sentence in this many is an anchor (see chunk_sentences)
+_ANCHOR_PERIOD = 2
+
+
+def _is_anchor(sentence: str) -> bool:
+    return zlib.crc32(sentence.encode("utf-8")) % _ANCHOR_PERIOD == 0
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Splits text into sentences, joining lines that were wrapped mid-sentence.
+    """
+    sentences = []
+    for part in _SENTENCE_BOUNDARY.split(text):
+        sentence = " ".join(part.split())
+        if sentence:
+            sentences.append(sentence)
+    return sentences
+
+
+def _measure(sentence: str, tokenizer, max_tokens: int) -> List[Tuple[str, int]]:
+    """
+    Returns (piece, token_count) pairs, cutting sentences that exceed the
+    budget into token windows.
+    """
+    ids = tokenizer.encode(sentence, add_special_tokens=False)
+    if len(ids) <= max_tokens:
+        return [(sentence, len(ids))]
+    windows = [ids[start : start + max_tokens] for start in range(0, len(ids), max_tokens)]
+    return [(tokenizer.decode(window).strip(), len(window)) for window in windows]
+
+
+def _overlap_tail(
+    pieces: List[str], lengths: List[int], overlap_tokens: int
+) -> Tuple[List[str], List[int], int]:
+    """
+    Returns the trailing pieces of a chunk that fit in overlap_tokens, with
+    their lengths and total.
+    """
+    carried: List[str] = []
+    carried_lengths: List[int] = []
+    carried_tokens = 0
+    for prev, prev_len in zip(reversed(pieces), reversed(lengths)):
+        if carried_tokens + prev_len > overlap_tokens:
+            break
+        carried.insert(0, prev)
+        carried_lengths.insert(0, prev_len)
+        carried_tokens += prev_len
+    return carried, carried_lengths, carried_tokens
+
+
+def chunk_sentences(
+    sentences: Iterable[str],
+    tokenizer,
+    max_tokens: int,
+    overlap_tokens: int = 0,
+    min_fill: float = 1.0,
+) -> Iterator[str]:
+    """
+    Packs sentences into chunks that fill up to max_tokens model tokens.
+
+    When overlap_tokens is set, the trailing sentences of each chunk that fit
+    in that budget are repeated at the start of the next chunk.
+
+    With min_fill below 1, a chunk that already holds min_fill * max_tokens
+    also ends after an anchor sentence (chosen by content hash). Boundaries
+    then depend on the text rather than on everything before it, so an edit
+    only changes the chunks around it and the rest stay reusable.
+    """
+    overlap_tokens = min(overlap_tokens, max_tokens // 2)
+
+    current: List[str] = []
+    current_lengths: List[int] = []
+    current_tokens = 0
+    # Leading pieces of current carried over from the previous chunk; a
+    # chunk is only emitted once it holds something new
+    carried = 0
+
+    for sentence in sentences:
+        for piece, length in _measure(sentence, tokenizer, max_tokens):
+            if current_tokens + length > max_tokens:
+                if len(current) > carried:
+                    yield " ".join(current)
+                    # Carry the tail of the previous chunk over as context
+                    current, current_lengths, current_tokens = _overlap_tail(
+                        current, current_lengths, overlap_tokens
+                    )
+                    carried = len(current)
+                if current_tokens + length > max_tokens:
+                    current, current_lengths, current_tokens = [], [], 0
+                    carried = 0
+
+            current.append(piece)
+            current_lengths.append(length)
+            current_tokens += length
+
+        if (
+            min_fill < 1.0
+            and len(current) > carried
+            and current_tokens >= max_tokens * min_fill
+            and _is_anchor(sentence)
+        ):
+            yield " ".join(current)
+            current, current_lengths, current_tokens = _overlap_tail(
+                current, current_lengths, overlap_tokens
+            )
+            carried = len(current)
+
+    if len(current) > carried:
+        yield " ".join(current)
+
+
+def chunk_text(
+    text: str, tokenizer, max_tokens: int, overlap_tokens: int = 0, min_fill: float = 1.0
+) -> List[str]:
+    """
+    Splits text into sentence-aligned chunks measured with the model tokenizer.
+    """
+    return list(
+        chunk_sentences(split_sentences(text), tokenizer, max_tokens, overlap_tokens, min_fill)
+    )
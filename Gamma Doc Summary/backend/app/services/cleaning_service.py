@@ -0,0 +1,192 @@
+import hashlib
+import heapq
+import math
+import re
+import zlib
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Sequence
+from app.core import config
+
+# Page breaks inside a single text, as written by the frontend's PDF extraction
+PAGE_BREAK = "\f"
+
+_PARAGRAPH_BOUNDARY = re.compile(r"\n\s*\n")
+# Page-number phrases inside running headers/footers: "page 3", "p. 3",
+# "3 of 12", "3/12", or a number set off by a separator at either end
+_PAGE_REFERENCE = re.compile(
+    r"\b(?:page|pg\.?|p\.)\s*\d+(?:\s*(?:of|/)\s*\d+)?\b"
+    r"|\b\d+\s*(?:of|/)\s*\d+\b"
+    r"|^\d+\s*[|\-\u2013\u2014\u00b7]\s*"
+    r"|\s*[|\-\u2013\u2014\u00b7]\s*\d+$"
+)
+_PAGE_NUMBER = re.compile(r"^\W*(page\s*)?\d+(\s*(of|/)\s*\d+)?\W*$", re.IGNORECASE)
+
+# Boilerplate lines must be at least this long to be dropped from the middle
+# of a page; short repeated lines ("Yes.", "Total") are usually content
+_MIN_BODY_LINE_CHARS = 20
+
+# Near-duplicate detection: hashes kept per paragraph, and how many of the
+# smallest are indexed for finding candidates
+_SKETCH_SIZE = 32
+_INDEX_HASHES = 4
+
+
+@dataclass
+class CleanResult:
+    pages: List[str]
+    lines_removed: int = 0
+    paragraphs_removed: int = 0
+    tokens_removed: int = 0
+    removed: List[str] = field(default_factory=list, repr=False)
+
+
+def split_pages(text: str) -> List[str]:
+    return text.split(PAGE_BREAK)
+
+
+def _line_key(line: str) -> str:
+    # Page numbers vary between otherwise identical headers ("Page 3 of 12");
+    # other numbers are kept, so body lines differing in figures stay apart
+    return _PAGE_REFERENCE.sub("#", " ".join(line.lower().split()))
+
+
+def _edge_indexes(lines: List[str]) -> List[int]:
+    """
+    Indexes of the first and last CLEAN_EDGE_LINES non-empty lines of a page,
+    where running headers and footers sit. On short pages the zone shrinks
+    so that at least one line is never treated as an edge line.
+    """
+    filled = [i for i, line in enumerate(lines) if line.strip()]
+    edge = min(config.CLEAN_EDGE_LINES, (len(filled) - 1) // 2)
+    if edge <= 0:
+        return []
+    return sorted(set(filled[:edge] + filled[-edge:]))
+
+
+def _repeated_lines(pages: List[List[str]]) -> Dict[str, set]:
+    """
+    Line keys that recur on enough pages to be boilerplate: "edge" keys
+    repeat in the header/footer zone, "body" keys anywhere on the page.
+    """
+    edge_counts: Counter = Counter()
+    body_counts: Counter = Counter()
+    for lines in pages:
+        edge_counts.update({_line_key(lines[i]) for i in _edge_indexes(lines)})
+        body_counts.update(
+            {" ".join(line.lower().split()) for line in lines if len(line.strip()) >= _MIN_BODY_LINE_CHARS}
+        )
+
+    threshold = max(2, math.ceil(config.CLEAN_REPEAT_MIN_FRACTION * len(pages)))
+    return {
+        "edge": {key for key, count in edge_counts.items() if key and count >= threshold},
+        "body": {key for key, count in body_counts.items() if count >= threshold},
+    }
+
+
+def _strip_lines(pages: List[str], result: CleanResult) -> List[str]:
+    split = [page.splitlines() for page in pages]
+    # Frequency across pages means nothing for a single page
+    repeated = _repeated_lines(split) if len(split) > 1 else {"edge": set(), "body": set()}
+
+    cleaned = []
+    for lines in split:
+        edges = set(_edge_indexes(lines))
+        kept = []
+        removed = []
+        for i, line in enumerate(lines):
+            drop = " ".join(line.lower().split()) in repeated["body"] or (
+                i in edges and (_line_key(line) in repeated["edge"] or _PAGE_NUMBER.match(line.strip()))
+            )
+            (removed if drop else kept).append(line)
+        if removed and not any(line.strip() for line in kept):
+            # Never strip a page to nothing; keep it as it was
+            kept, removed = lines, []
+        result.lines_removed += len(removed)
+        result.removed.extend(removed)
+        cleaned.append("\n".join(kept))
+    return cleaned
+
+
+def _sketch(words: List[str]) -> List[int]:
+    """
+    Bottom-k sketch: the _SKETCH_SIZE smallest hashes of the paragraph's
+    word 3-grams, a fixed-size sample for estimating Jaccard similarity.
+    """
+    shingles = {
+        zlib.crc32(" ".join(words[i : i + 3]).encode("utf-8"))
+        for i in range(max(1, len(words) - 2))
+    }
+    return heapq.nsmallest(_SKETCH_SIZE, shingles)
+
+
+def _similarity(a: List[int], b: List[int]) -> float:
+    union = heapq.nsmallest(_SKETCH_SIZE, set(a) | set(b))
+    shared = set(a) & set(b)
+    return sum(1 for value in union if value in shared) / len(union)
+
+
+def _dedupe_paragraphs(pages: List[str], result: CleanResult) -> List[str]:
+    """
+    Drops paragraphs of at least CLEAN_MIN_PARAGRAPH_WORDS words already
+    seen earlier in the document, either exactly or as a near-duplicate
+    (estimated 3-gram Jaccard similarity of at least
+    CLEAN_NEAR_DUP_SIMILARITY). Shorter paragraphs ("Yes.") are always kept.
+    """
+    seen_exact = set()
+    sketches: List[List[int]] = []
+    # Smallest hashes -> sketches containing them; near-duplicates almost
+    # always share one, so only those are compared
+    index: Dict[int, List[int]] = {}
+
+    cleaned = []
+    for page in pages:
+        kept = []
+        for paragraph in _PARAGRAPH_BOUNDARY.split(page):
+            words = paragraph.lower().split()
+            if not words:
+                continue
+            if len(words) < config.CLEAN_MIN_PARAGRAPH_WORDS:
+                kept.append(paragraph)
+                continue
+            exact = hashlib.sha1(" ".join(words).encode("utf-8")).digest()
+            duplicate = exact in seen_exact
+            sketch = None
+            if not duplicate:
+                sketch = _sketch(words)
+                candidates = {i for value in sketch[:_INDEX_HASHES] for i in index.get(value, ())}
+                duplicate = any(
+                    _similarity(sketch, sketches[i]) >= config.CLEAN_NEAR_DUP_SIMILARITY
+                    for i in candidates
+                )
+
+            if duplicate:
+                result.paragraphs_removed += 1
+                result.removed.append(paragraph)
+                continue
+            seen_exact.add(exact)
+            if sketch is not None:
+                for value in sketch[:_INDEX_HASHES]:
+                    index.setdefault(value, []).append(len(sketches))
+                sketches.append(sketch)
+            kept.append(paragraph)
+        cleaned.append("\n\n".join(kept))
+    return cleaned
+
+
+def clean_pages(
+    pages: Sequence[str], count_tokens: Callable[[str], int] = lambda text: len(text.split())
+) -> CleanResult:
+    """
+    Removes repeated headers, footers, page numbers and boilerplate lines,
+    then exact and near-duplicate paragraphs. tokens_removed is measured
+    with count_tokens, which defaults to a word count. A document that would
+    clean to nothing is returned unchanged.
+    """
+    result = CleanResult(pages=list(pages))
+    result.pages = _dedupe_paragraphs(_strip_lines(result.pages, result), result)
+    if not any(page.strip() for page in result.pages):
+        return CleanResult(pages=list(pages))
+    if result.removed:
+        result.tokens_removed = count_tokens("\n".join(result.removed))
+    return result
@@ -0,0 +1,80 @@
+import importlib.util
+import os
+from typing import Callable, Dict
+from app.core import config
+
+# Optional: ONNX Runtime through Hugging Face Optimum. Only looked up here;
+# importing it pulls in torch and transformers, so that waits for _load_onnx
+HAS_ONNXRUNTIME = (
+    importlib.util.find_spec("optimum") is not None
+    and importlib.util.find_spec("onnxruntime") is not None
+)
+
+
+def _load_pytorch(model_name: str):
+    from transformers import pipeline
+
+    return pipeline("summarization", model=model_name)
+
+
+def _load_int8(model_name: str):
+    """
+    PyTorch fp32 model with its Linear layers dynamically quantized to int8.
+    """
+    import torch
+    from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, pipeline
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+    model = torch.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8
+    )
+    return pipeline("summarization", model=model, tokenizer=tokenizer)
+
+
+def _load_onnx(model_name: str):
+    """
+    ONNX Runtime model, exported once and reused from ONNX_MODEL_DIR.
+    """
+    if not HAS_ONNXRUNTIME:
+        raise RuntimeError(
+            "ONNX engine requires optimum with onnxruntime: pip install 'optimum[onnxruntime]'"
+        )
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    from transformers import AutoTokenizer, pipeline
+
+    export_dir = os.path.join(config.ONNX_MODEL_DIR, model_name.replace("/", "--"))
+    if os.path.isdir(export_dir):
+        model = ORTModelForSeq2SeqLM.from_pretrained(export_dir)
+        tokenizer = AutoTokenizer.from_pretrained(export_dir)
+    else:
+        model = ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True)
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        model.save_pretrained(export_dir)
+        tokenizer.save_pretrained(export_dir)
+    return pipeline("summarization", model=model, tokenizer=tokenizer)
+
+
+# Engine name -> loader returning a transformers summarization pipeline
+ENGINES: Dict[str, Callable] = {
+    "pytorch": _load_pytorch,
+    "int8": _load_int8,
+    "onnx": _load_onnx,
+}
+
+# Engines that skip the model: "extractive" picks sentences from the text,
+# "auto" chooses between it and SUMMARY_ENGINE per request
+EXTRACTIVE = "extractive"
+AUTO = "auto"
+ENGINE_CHOICES = list(ENGINES) + [EXTRACTIVE, AUTO]
+
+
+def load_engine(engine: str, model_name: str):
+    """
+    Builds the summarization pipeline for the given inference engine.
+    """
+    if engine not in ENGINES:
+        raise ValueError(
+            f"Unknown summarization engine '{engine}'. Choose from: {', '.join(ENGINES)}"
+        )
+    return ENGINES[engine](model_name)
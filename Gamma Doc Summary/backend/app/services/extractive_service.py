@@ -0,0 +1,117 @@
+import re
+from collections import Counter
+from typing import List, Sequence, Tuple
+import numpy as np
+from app.core import config
+from app.services.chunker import split_sentences
+from app.services.keyword_service import STOPWORDS
+
+_WORD = re.compile(r"[A-Za-z][A-Za-z\-']+")
+
+
+def _weighted_entries(sentences: List[str], max_terms: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """
+    Sparse sentence x term TF-IDF matrix as (rows, cols, values, n_terms),
+    over the max_terms most frequent terms, with L2-normalized rows.
+    """
+    counts = [
+        Counter(w for w in (word.lower() for word in _WORD.findall(s)) if len(w) > 2 and w not in STOPWORDS)
+        for s in sentences
+    ]
+    frequencies = Counter()
+    for sentence_counts in counts:
+        frequencies.update(sentence_counts)
+    vocabulary = {term: i for i, (term, _) in enumerate(frequencies.most_common(max_terms))}
+
+    rows, cols, values = [], [], []
+    for row, sentence_counts in enumerate(counts):
+        for term, count in sentence_counts.items():
+            col = vocabulary.get(term)
+            if col is not None:
+                rows.append(row)
+                cols.append(col)
+                values.append(count)
+
+    rows = np.asarray(rows, dtype=np.intp)
+    cols = np.asarray(cols, dtype=np.intp)
+    values = np.asarray(values, dtype=np.float64)
+
+    df = np.bincount(cols, minlength=len(vocabulary))
+    values *= (np.log((1.0 + len(sentences)) / (1.0 + df)) + 1.0)[cols]
+    norms = np.sqrt(np.bincount(rows, weights=values ** 2, minlength=len(sentences)))
+    norms[norms == 0] = 1.0
+    values /= norms[rows]
+    return rows, cols, values, len(vocabulary)
+
+
+def _textrank(rows, cols, values, shape, damping: float = 0.85, iterations: int = 30) -> np.ndarray:
+    """
+    PageRank over the cosine-similarity graph of the sentences.
+    """
+    matrix = np.zeros(shape, dtype=np.float32)
+    matrix[rows, cols] = values
+    similarity = matrix @ matrix.T
+    np.fill_diagonal(similarity, 0.0)
+    out_weight = similarity.sum(axis=1, keepdims=True)
+    out_weight[out_weight == 0] = 1.0
+    transition = similarity / out_weight
+
+    n = shape[0]
+    scores = np.full(n, 1.0 / n, dtype=np.float32)
+    for _ in range(iterations):
+        updated = (1 - damping) / n + damping * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < 1e-6:
+            return updated
+        scores = updated
+    return scores
+
+
+def _centroid(rows, cols, values, shape) -> np.ndarray:
+    """
+    Cosine similarity of every sentence to the document centroid, computed
+    on the sparse entries so it stays linear in the text size.
+    """
+    centroid = np.bincount(cols, weights=values, minlength=shape[1]) / shape[0]
+    norm = np.linalg.norm(centroid)
+    if not norm:
+        return np.zeros(shape[0])
+    return np.bincount(rows, weights=values * (centroid / norm)[cols], minlength=shape[0])
+
+
+def summarize_extractive(pages: Sequence[str], target_words: int) -> str:
+    """
+    Picks the highest-scoring sentences, in document order, until about
+    target_words words are selected. Uses TextRank for up to
+    TEXTRANK_MAX_SENTENCES sentences and centroid scoring beyond that.
+    """
+    sentences = [s for page in pages for s in split_sentences(page)]
+    if len(sentences) <= 1:
+        return " ".join(sentences)
+
+    rows, cols, values, n_terms = _weighted_entries(sentences, config.TEXTRANK_MAX_TERMS)
+    shape = (len(sentences), n_terms)
+    if len(sentences) <= config.TEXTRANK_MAX_SENTENCES:
+        scores = _textrank(rows, cols, values, shape)
+    else:
+        scores = _centroid(rows, cols, values, shape)
+
+    chosen, words = [], 0
+    for index in np.argsort(-scores, kind="stable"):
+        length = len(sentences[index].split())
+        # Skip sentences that would overshoot; a shorter one may still fit
+        if chosen and words + length > target_words:
+            continue
+        chosen.append(index)
+        words += length
+        if words >= target_words * 0.9:
+            break
+    return " ".join(sentences[i] for i in sorted(chosen))
+
+
+def target_words(summary_length: str) -> int:
+    """
+    Word budget for an extractive summary, from SUMMARY_TARGET_TOKENS.
+    """
+    targets = config.SUMMARY_TARGET_TOKENS
+    # Roughly 0.75 words per BART token
+    return int(targets.get(summary_length, targets["medium"]) * 0.75)
@@ -0,0 +1,129 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from app.core import config
+from app.services.summarizer_service import summarize_document
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+
+@dataclass
+class Job:
+    job_id: str
+    status: str = QUEUED
+    chunks_done: int = 0
+    chunks_total: int = 0
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    # Bumped on every change so that progress streams can detect updates
+    version: int = 0
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (COMPLETED, FAILED)
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "chunks_done": self.chunks_done,
+            "chunks_total": self.chunks_total,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+_jobs: Dict[str, Job] = {}
+_jobs_lock = threading.Lock()
+_executor = ThreadPoolExecutor(max_workers=config.JOB_WORKERS, thread_name_prefix="summary-job")
+
+
+def _update(job: Job, **changes) -> None:
+    with _jobs_lock:
+        for name, value in changes.items():
+            setattr(job, name, value)
+        job.version += 1
+
+
+def _prune() -> None:
+    """
+    Forgets finished jobs older than JOB_TTL_SECONDS.
+    """
+    cutoff = time.time() - config.JOB_TTL_SECONDS
+    with _jobs_lock:
+        expired = [
+            job_id
+            for job_id, job in _jobs.items()
+            if job.finished and job.finished_at and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del _jobs[job_id]
+
+
+def _run(
+    job: Job,
+    text: str,
+    summary_length: str,
+    engine: Optional[str],
+    mode: str,
+    keyword_engine: Optional[str],
+    latency_budget_ms: Optional[int],
+) -> None:
+    _update(job, status=RUNNING)
+    try:
+        result = summarize_document(
+            text,
+            summary_length,
+            engine=engine,
+            mode=mode,
+            progress=lambda done, total: _update(job, chunks_done=done, chunks_total=total),
+            keyword_engine=keyword_engine,
+            latency_budget_ms=latency_budget_ms,
+        )
+        result.pop("cache", None)
+        _update(job, status=COMPLETED, result=result, finished_at=time.time())
+    except Exception as e:
+        print(f"Summarization job {job.job_id} failed: {e}")
+        _update(job, status=FAILED, error=str(e), finished_at=time.time())
+
+
+def submit_job(
+    text: str,
+    summary_length: str = "medium",
+    engine: Optional[str] = None,
+    mode: str = "concat",
+    keyword_engine: Optional[str] = None,
+    latency_budget_ms: Optional[int] = None,
+) -> Job:
+    """
+    Queues a summarization job and returns it immediately.
+    """
+    _prune()
+    job = Job(job_id=uuid.uuid4().hex)
+    with _jobs_lock:
+        _jobs[job.job_id] = job
+    _executor.submit(
+        _run, job, text, summary_length, engine, mode, keyword_engine, latency_budget_ms
+    )
+    return job
+
+
+def get_job(job_id: str) -> Optional[Job]:
+    with _jobs_lock:
+        return _jobs.get(job_id)
+
+
+def snapshot(job: Job) -> dict:
+    """
+    Returns a consistent copy of the job state, including its version.
+    """
+    with _jobs_lock:
+        return dict(job.to_dict(), version=job.version)
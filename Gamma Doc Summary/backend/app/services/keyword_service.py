@@ -0,0 +1,175 @@
+import multiprocessing
+import re
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from app.core import config
+
+_yake_extractor = None
+_tfidf_pool: Optional[ProcessPoolExecutor] = None
+_lock = threading.Lock()
+
+_WORD = re.compile(r"[A-Za-z][A-Za-z\-']+")
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+STOPWORDS = frozenset(
+    """
+    a about above after again against all also am an and any are as at be because been
+    before being below between both but by can could did do does doing down during each
+    few for from further had has have having he her here hers herself him himself his how
+    however i if in into is it its itself just may me might more most must my myself no
+    nor not now of off on once only or other our ours ourselves out over own same shall
+    she should so some such than that the their theirs them themselves then there these
+    they this those through to too under until up upon very was we were what when where
+    which while who whom why will with within without would yet you your yours yourself
+    yourselves one two three per via etc page
+    """.split()
+)
+
+
+def get_yake_extractor():
+    """
+    Returns the YAKE keyword extractor, building it on first call.
+    """
+    global _yake_extractor
+    if _yake_extractor is None:
+        with _lock:
+            if _yake_extractor is None:
+                import yake
+
+                # Keyword extraction settings
+                _yake_extractor = yake.KeywordExtractor(
+                    lan="en", n=1, dedupLim=0.9, dedupFunc="seqm", windowsSize=1,
+                    top=config.KEYWORD_TOP, features=None,
+                )
+    return _yake_extractor
+
+
+def is_ready() -> bool:
+    return _yake_extractor is not None or config.KEYWORD_ENGINE != "yake"
+
+
+def extract_keywords_yake(pages: Sequence[str]) -> List[str]:
+    # YAKE scores co-occurrence across the whole text, so it needs one string
+    keywords = get_yake_extractor().extract_keywords("\n".join(pages))
+    return [kw for kw, score in keywords]
+
+
+def _split_for_counting(pages: Sequence[str]) -> List[str]:
+    """
+    Groups paragraphs into pieces of about KEYWORD_CHUNK_CHARS characters.
+    Each piece is one "document" for the IDF term.
+    """
+    pieces, current, size = [], [], 0
+    for page in pages:
+        for paragraph in _PARAGRAPH_BREAK.split(page):
+            current.append(paragraph)
+            size += len(paragraph)
+            if size >= config.KEYWORD_CHUNK_CHARS:
+                pieces.append("\n".join(current))
+                current, size = [], 0
+    if current:
+        pieces.append("\n".join(current))
+    return pieces
+
+
+def count_terms(piece: str) -> Dict[str, int]:
+    """
+    Term frequencies of one piece, ignoring stopwords and very short words.
+    """
+    words = (word.lower() for word in _WORD.findall(piece))
+    return Counter(word for word in words if len(word) > 2 and word not in STOPWORDS)
+
+
+def _get_tfidf_pool() -> ProcessPoolExecutor:
+    global _tfidf_pool
+    if _tfidf_pool is None:
+        with _lock:
+            if _tfidf_pool is None:
+                _tfidf_pool = ProcessPoolExecutor(
+                    max_workers=config.KEYWORD_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _tfidf_pool
+
+
+def _score(counts: List[Dict[str, int]]) -> List[Tuple[str, float]]:
+    """
+    Merges per-piece counts into a piece x term matrix and ranks terms by
+    summed TF-IDF weight.
+    """
+    vocabulary: Dict[str, int] = {}
+    rows, cols, values = [], [], []
+    for row, piece_counts in enumerate(counts):
+        for term, count in piece_counts.items():
+            rows.append(row)
+            cols.append(vocabulary.setdefault(term, len(vocabulary)))
+            values.append(count)
+    if not vocabulary:
+        return []
+
+    rows, cols = np.asarray(rows), np.asarray(cols)
+    values = np.asarray(values, dtype=np.float64)
+    n_pieces = len(counts)
+
+    # Sub-linear term frequency, normalized per piece
+    tf = 1.0 + np.log(values)
+    tf /= np.bincount(rows, weights=tf, minlength=n_pieces)[rows]
+
+    df = np.bincount(cols, minlength=len(vocabulary))
+    idf = np.log((1.0 + n_pieces) / (1.0 + df)) + 1.0
+
+    # Spread-out terms matter more than a term repeated in one piece
+    scores = np.bincount(cols, weights=tf * idf[cols], minlength=len(vocabulary))
+    scores *= np.log1p(df)
+
+    terms = np.array(list(vocabulary))
+    top = np.argsort(-scores, kind="stable")[: config.KEYWORD_TOP]
+    return [(terms[i], float(scores[i])) for i in top]
+
+
+def extract_keywords_tfidf(pages: Sequence[str]) -> List[str]:
+    """
+    Vectorized TF-IDF keywords. Counting is linear in the text and runs in
+    parallel for very large inputs; scoring happens on NumPy arrays.
+    """
+    pieces = _split_for_counting(pages)
+    total_chars = sum(len(piece) for piece in pieces)
+    if total_chars >= config.KEYWORD_PARALLEL_MIN_CHARS and len(pieces) > 1:
+        counts = list(_get_tfidf_pool().map(count_terms, pieces))
+    else:
+        counts = [count_terms(piece) for piece in pieces]
+    return [term for term, score in _score(counts)]
+
+
+KEYWORD_ENGINES = {
+    "yake": extract_keywords_yake,
+    "tfidf": extract_keywords_tfidf,
+}
+
+
+def extract_keywords(text: Union[str, Sequence[str]], engine: Optional[str] = None) -> List[str]:
+    """
+    Extracts the top keywords from the given text, or sequence of page
+    texts, with the chosen engine.
+    """
+    engine = engine or config.KEYWORD_ENGINE
+    if engine not in KEYWORD_ENGINES:
+        raise ValueError(
+            f"Unknown keyword engine '{engine}'. Choose from: {', '.join(KEYWORD_ENGINES)}"
+        )
+    pages = [text] if isinstance(text, str) else text
+    return KEYWORD_ENGINES[engine](pages)
+
+
+def shutdown_pool() -> None:
+    """
+    Stops the TF-IDF counting processes, e.g. on server shutdown.
+    """
+    global _tfidf_pool
+    with _lock:
+        if _tfidf_pool is not None:
+            _tfidf_pool.shutdown()
+        _tfidf_pool = None
@@ -0,0 +1,147 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+from app.core import config
+from app.services import summarizer_service
+from app.services.chunker import split_sentences
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _init_worker(engine: Optional[str], threads: int) -> None:
+    """
+    Pins the worker's thread count and loads its own model instance.
+    Workers batch their own slices, so the shared scheduler stays off.
+    """
+    config.SCHEDULER_ENABLED = False
+    os.environ["OMP_NUM_THREADS"] = str(threads)
+    import torch
+
+    torch.set_num_threads(threads)
+    summarizer_service.get_summarizer(engine)
+
+
+def _summarize_slice(
+    chunks: List[str], summary_length: str, batch_size: Optional[int], engine: Optional[str]
+) -> Tuple[List[str], Dict[str, int]]:
+    stats: Dict[str, int] = {}
+    summaries = summarizer_service.summarize_chunks(
+        chunks, summarizer_service.get_length_ratios(summary_length), batch_size, engine, stats=stats
+    )
+    return summaries, stats
+
+
+def get_pool(workers: Optional[int] = None, engine: Optional[str] = None) -> ProcessPoolExecutor:
+    """
+    Returns the shared worker pool. Passing a different worker count
+    replaces the running pool.
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None and workers in (None, _pool_workers):
+            return _pool
+        if _pool is not None:
+            _pool.shutdown()
+
+        workers = workers or config.MAPREDUCE_WORKERS
+        if workers == config.MAPREDUCE_WORKERS:
+            threads = config.MAPREDUCE_THREADS_PER_WORKER
+        else:
+            threads = max(1, (os.cpu_count() or 1) // workers)
+        # spawn, not fork: forked torch thread pools can deadlock
+        _pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(engine, threads),
+        )
+        _pool_workers = workers
+        return _pool
+
+
+def shutdown_pool() -> None:
+    """
+    Stops the worker processes, e.g. on server shutdown.
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+        _pool, _pool_workers = None, 0
+
+
+def _map(
+    chunks: List[str],
+    summary_length: str,
+    batch_size: Optional[int],
+    engine: Optional[str],
+    progress: Optional[summarizer_service.ProgressCallback] = None,
+    stats: Optional[Dict[str, int]] = None,
+    on_chunk: Optional[summarizer_service.ChunkCallback] = None,
+) -> List[str]:
+    """
+    Summarizes chunks across the pool, one batch-sized slice per task.
+    """
+    batch_size = batch_size or config.SUMMARY_BATCH_SIZE
+    pool = get_pool(engine=engine)
+    futures = {
+        pool.submit(_summarize_slice, chunks[start : start + batch_size], summary_length, batch_size, engine): start
+        for start in range(0, len(chunks), batch_size)
+    }
+
+    results = {}
+    done = 0
+    for future in as_completed(futures):
+        start = futures[future]
+        results[start], slice_stats = future.result()
+        done += len(results[start])
+        if stats is not None:
+            for name, count in slice_stats.items():
+                stats[name] = stats.get(name, 0) + count
+        if progress:
+            progress(done, len(chunks))
+        if on_chunk:
+            for offset, summary in enumerate(results[start]):
+                if summary:
+                    on_chunk(start + offset, len(chunks), summary)
+
+    summaries = [summary for start in sorted(results) for summary in results[start]]
+    return [summary for summary in summaries if summary]
+
+
+def summarize_map_reduce(
+    chunks: List[str],
+    summary_length: str = "medium",
+    batch_size: Optional[int] = None,
+    engine: Optional[str] = None,
+    progress: Optional[summarizer_service.ProgressCallback] = None,
+    stats: Optional[Dict[str, int]] = None,
+    on_chunk: Optional[summarizer_service.ChunkCallback] = None,
+) -> str:
+    """
+    Summarizes chunks in parallel, then recursively summarizes the joined
+    summaries until they fit the target size for summary_length.
+    """
+    tokenizer = summarizer_service.get_tokenizer()
+    target = config.SUMMARY_TARGET_TOKENS.get(summary_length, config.SUMMARY_TARGET_TOKENS["medium"])
+
+    # Progress and partial summaries cover the map step, which holds nearly
+    # all of the work
+    summary = " ".join(
+        _map(chunks, summary_length, batch_size, engine, progress, stats, on_chunk)
+    )
+    for _ in range(config.MAPREDUCE_MAX_ROUNDS):
+        if len(tokenizer.encode(summary, add_special_tokens=False)) <= target:
+            break
+        chunks = summarizer_service.make_chunks(split_sentences(summary))
+        reduced = " ".join(_map(chunks, summary_length, batch_size, engine))
+        # Stop if a round no longer shrinks the text
+        if len(reduced) >= len(summary):
+            break
+        summary = reduced
+
+    return summary.strip()
@@ -0,0 +1,109 @@
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional
+from fastapi import UploadFile
+from app.core import config
+
+# Optional: PyMuPDF for server-side PDF extraction
+try:
+    import fitz  # PyMuPDF
+    HAS_PYMUPDF = True
+except Exception:
+    HAS_PYMUPDF = False
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+async def spool_upload(file: UploadFile, directory: str) -> str:
+    """
+    Streams an upload to a file in directory, enforcing MAX_UPLOAD_BYTES.
+    """
+    path = os.path.join(directory, "upload.pdf")
+    size = 0
+    with open(path, "wb") as f:
+        while True:
+            block = await file.read(config.UPLOAD_CHUNK_BYTES)
+            if not block:
+                break
+            size += len(block)
+            if size > config.MAX_UPLOAD_BYTES:
+                raise UploadTooLarge(f"Upload exceeds {config.MAX_UPLOAD_BYTES} bytes")
+            f.write(block)
+    return path
+
+
+def make_upload_dir() -> str:
+    return tempfile.mkdtemp(prefix="doc-summary-")
+
+
+def remove_upload_dir(directory: str) -> None:
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def _extract_pages(path: str, start: int, stop: int) -> List[str]:
+    with fitz.open(path) as pdf:
+        return [pdf[number].get_text() for number in range(start, stop)]
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(
+                    max_workers=config.PDF_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _pool
+
+
+def iter_pdf_pages(path: str) -> Iterator[str]:
+    """
+    Yields page texts in order. Ranges of PDF_PAGES_PER_TASK pages are
+    extracted in parallel worker processes, each opening the file itself.
+    """
+    if not HAS_PYMUPDF:
+        raise RuntimeError("PDF extraction requires PyMuPDF: pip install pymupdf")
+
+    with fitz.open(path) as pdf:
+        page_count = pdf.page_count
+
+    step = config.PDF_PAGES_PER_TASK
+    if config.PDF_WORKERS <= 1 or page_count <= step:
+        yield from _extract_pages(path, 0, page_count)
+        return
+
+    starts = range(0, page_count, step)
+    stops = [min(start + step, page_count) for start in starts]
+    for pages in _get_pool().map(_extract_pages, [path] * len(starts), starts, stops):
+        yield from pages
+
+
+def extract_pdf_bytes(data: bytes) -> List[str]:
+    """
+    Page texts of an in-memory PDF, e.g. a zip archive member.
+    """
+    if not HAS_PYMUPDF:
+        raise RuntimeError("PDF extraction requires PyMuPDF: pip install pymupdf")
+    with fitz.open(stream=data, filetype="pdf") as pdf:
+        return [page.get_text() for page in pdf]
+
+
+def shutdown_pool() -> None:
+    """
+    Stops the extraction processes, e.g. on server shutdown.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+        _pool = None
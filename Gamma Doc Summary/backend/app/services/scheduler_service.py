@@ -0,0 +1,83 @@
+import queue
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future
+from typing import Callable, List, Optional
+
+# run_batch(texts, max_length, min_length) -> one summary per text
+BatchRunner = Callable[[List[str], int, int], List[str]]
+
+_STOP = object()
+
+
+class BatchScheduler:
+    """
+    Collects chunks submitted from any thread and runs them as shared
+    batches on one background thread.
+
+    The thread takes the first waiting chunk, then keeps collecting for up
+    to max_wait_ms or until max_batch chunks are queued. Chunks with the
+    same generation lengths go through one forward pass together and each
+    caller's future receives its own summary.
+    """
+
+    def __init__(self, run_batch: BatchRunner, max_wait_ms: float, max_batch: int, name: str = "inference"):
+        self.run_batch = run_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_batch = max_batch
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._loop, name=f"{name}-scheduler", daemon=True)
+        self._thread.start()
+
+    def submit(self, text: str, max_length: int, min_length: int) -> Future:
+        future: Future = Future()
+        self._queue.put((text, max_length, min_length, future))
+        return future
+
+    def stop(self) -> None:
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _collect(self) -> Optional[list]:
+        item = self._queue.get()
+        if item is _STOP:
+            return None
+        batch = [item]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                # Finish this batch, then stop
+                self._queue.put(_STOP)
+                break
+            batch.append(item)
+        return batch
+
+    def _loop(self) -> None:
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+
+            groups = defaultdict(list)
+            for text, max_length, min_length, future in batch:
+                if future.set_running_or_notify_cancel():
+                    groups[(max_length, min_length)].append((text, future))
+
+            for (max_length, min_length), items in groups.items():
+                items.sort(key=lambda item: len(item[0]))
+                try:
+                    summaries = self.run_batch([text for text, _ in items], max_length, min_length)
+                except Exception as e:
+                    for _, future in items:
+                        future.set_exception(e)
+                    continue
+                for (_, future), summary in zip(items, summaries):
+                    future.set_result(summary)
@@ -1,73 +1,513 @@
-from transformers import pipeline
-import yake
-from typing import List
+import threading
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from app.core import config
+from app.services.cache_service import get_chunk_cache, get_result_cache, make_key, text_hash
+from app.services.chunker import chunk_sentences, split_sentences
+from app.services.cleaning_service import CleanResult, clean_pages, split_pages
+from app.services.engines import AUTO, EXTRACTIVE, load_engine
+from app.services.extractive_service import summarize_extractive, target_words
+from app.services import keyword_service
+from app.services.scheduler_service import BatchScheduler
 
-# Initialize the summarizer pipeline
-summarizer = pipeline("summarization", model="facebook/bart-large-cnn")
+# Models are built on first use so that importing this module stays cheap
+_summarizers: Dict[str, object] = {}
+_tokenizer = None
+_schedulers: Dict[str, BatchScheduler] = {}
+# Guards the registries above; each engine and the tokenizer load under
+# their own lock, so one slow model load does not hold up the others
+_load_lock = threading.Lock()
+_engine_locks: Dict[str, threading.Lock] = {}
+_tokenizer_lock = threading.Lock()
 
-# Keyword extraction settings
-keyword_extractor = yake.KeywordExtractor(
-    lan="en", n=1, dedupLim=0.9, dedupFunc="seqm", windowsSize=1, top=10, features=None
+# Keywords are extracted here while the summary is generated
+_keyword_executor = ThreadPoolExecutor(
+    max_workers=config.KEYWORD_WORKERS, thread_name_prefix="keywords"
 )
 
+# Called as progress(chunks_done, chunks_total) while chunks are summarized
+ProgressCallback = Callable[[int, int], None]
 
-def extract_keywords(text: str) -> List[str]:
+# Called as on_chunk(index, chunks_total, summary) as each chunk summary is ready
+ChunkCallback = Callable[[int, int, str], None]
+
+# A document is either one string or a sequence of page texts
+Document = Union[str, Sequence[str]]
+
+# Summary length as a fraction of the chunk's token count; chunks run up to
+# CHUNK_MAX_TOKENS, so a full chunk gives roughly 150 / 300 / 400 tokens
+LENGTH_MULTIPLIERS = {
+    "short": {"max_ratio": 0.15, "min_ratio": 0.05},
+    "medium": {"max_ratio": 0.3, "min_ratio": 0.15},
+    "long": {"max_ratio": 0.5, "min_ratio": 0.25},
+}
+
+WARM_UP_TEXT = (
+    "The committee met on Monday to review the quarterly budget. "
+    "Members agreed to postpone the new hiring plan until the next review."
+)
+
+
+def get_summarizer(engine: Optional[str] = None):
+    """
+    Returns the summarization pipeline for an engine, loading it on first call.
+    """
+    engine = engine or config.SUMMARY_ENGINE
+    summarizer = _summarizers.get(engine)
+    if summarizer is None:
+        with _load_lock:
+            engine_lock = _engine_locks.setdefault(engine, threading.Lock())
+        with engine_lock:
+            summarizer = _summarizers.get(engine)
+            if summarizer is None:
+                summarizer = load_engine(engine, config.SUMMARY_MODEL)
+                _summarizers[engine] = summarizer
+    return summarizer
+
+
+def _run_pipeline(
+    engine: Optional[str], texts: List[str], max_len: int, min_len: int, batch_size: int
+) -> List[str]:
+    results = get_summarizer(engine)(
+        texts,
+        max_length=max_len,
+        min_length=min_len,
+        do_sample=False,
+        batch_size=batch_size,
+    )
+    summaries = []
+    for result in results:
+        # The pipeline may return a nested list per input
+        if isinstance(result, list):
+            result = result[0]
+        summaries.append(result["summary_text"])
+    return summaries
+
+
+def get_scheduler(engine: Optional[str] = None) -> BatchScheduler:
+    """
+    Returns the micro-batching scheduler shared by all requests for an engine.
+    """
+    engine = engine or config.SUMMARY_ENGINE
+    scheduler = _schedulers.get(engine)
+    if scheduler is None:
+        with _load_lock:
+            scheduler = _schedulers.get(engine)
+            if scheduler is None:
+                scheduler = BatchScheduler(
+                    lambda texts, max_len, min_len: _run_pipeline(
+                        engine, texts, max_len, min_len, len(texts)
+                    ),
+                    config.INFERENCE_MAX_WAIT_MS,
+                    config.INFERENCE_MAX_BATCH,
+                    name=engine,
+                )
+                _schedulers[engine] = scheduler
+    return scheduler
+
+
+def get_tokenizer():
+    """
+    Returns the model tokenizer without loading the model weights.
+    """
+    global _tokenizer
+    if _tokenizer is None:
+        with _tokenizer_lock:
+            if _tokenizer is None:
+                from transformers import AutoTokenizer
+
+                _tokenizer = AutoTokenizer.from_pretrained(config.SUMMARY_MODEL)
+    return _tokenizer
+
+
+def is_ready() -> bool:
+    """
+    Reports whether the models are loaded and can serve requests.
+    """
+    return config.SUMMARY_ENGINE in _summarizers and keyword_service.is_ready()
+
+
+def warm_up() -> None:
+    """
+    Loads the models and runs one small inference so the first request
+    does not pay for lazy initialization.
+    """
+    if config.KEYWORD_ENGINE == "yake":
+        keyword_service.get_yake_extractor()
+    # Straight to the pipeline: through summarize_chunks, a chunk cache hit
+    # on later starts would skip loading the model
+    max_len, min_len = _generation_params(WARM_UP_TEXT, get_length_ratios("medium"))
+    _run_pipeline(None, [WARM_UP_TEXT], max_len, min_len, 1)
+
+
+def extract_keywords(text: Document, engine: Optional[str] = None) -> List[str]:
     """
     Extracts the top keywords from the given text.
     """
-    keywords = keyword_extractor.extract_keywords(text)
-    return [kw for kw, score in keywords]
+    return keyword_service.extract_keywords(text, engine)
 
 
-def summarize_text(
-    text: str, summary_length: str = "medium", max_chunk: int = 500
-) -> str:
+def get_length_ratios(summary_length: str) -> Dict[str, float]:
     """
-    Summarizes the given text based on the desired length.
+    Returns the summary/input length ratios for a summary length option.
     """
-    length_multipliers = {
-        "short": {"max_ratio": 0.3, "min_ratio": 0.1},
-        "medium": {"max_ratio": 0.5, "min_ratio": 0.2},
-        "long": {"max_ratio": 0.7, "min_ratio": 0.4},
-    }
+    return LENGTH_MULTIPLIERS.get(summary_length, LENGTH_MULTIPLIERS["medium"])
+
+
+def _generation_params(chunk: str, ratios: Dict[str, float]) -> Tuple[int, int]:
+    """
+    Computes (max_length, min_length) for a chunk, rounded to the length bucket.
+    """
+    token_len = count_tokens(chunk)
+
+    # Define dynamic max and min length for the summary
+    max_len = min(config.SUMMARY_MAX_LENGTH, int(token_len * ratios["max_ratio"]))
+    min_len = max(config.SUMMARY_MIN_LENGTH, int(token_len * ratios["min_ratio"]))
+
+    # Round down so that chunks of similar size can share a batch
+    if max_len >= config.LENGTH_BUCKET:
+        max_len -= max_len % config.LENGTH_BUCKET
+    min_len -= min_len % config.LENGTH_BUCKET
+
+    if min_len > max_len:
+        min_len = max_len // 2
 
-    ratios = length_multipliers.get(summary_length, length_multipliers["medium"])
-    max_ratio = ratios["max_ratio"]
-    min_ratio = ratios["min_ratio"]
+    return max_len, min_len
 
-    sentences = text.splitlines()
-    chunks = []
-    current_chunk = ""
 
-    for sentence in sentences:
-        if len(current_chunk) + len(sentence) + 1 < max_chunk:
-            current_chunk += sentence + " "
-        else:
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-            current_chunk = sentence + " "
+def _chunk_key(chunk: str, max_len: int, min_len: int, engine: Optional[str]) -> str:
+    return make_key(
+        "chunk",
+        text_hash(chunk),
+        max_len,
+        min_len,
+        config.SUMMARY_MODEL,
+        engine or config.SUMMARY_ENGINE,
+        config.CACHE_VERSION,
+    )
 
-    if current_chunk:
-        chunks.append(current_chunk.strip())
 
-    summary_parts = []
-    for chunk in chunks:
+def summarize_chunks(
+    chunks: List[str],
+    ratios: Dict[str, float],
+    batch_size: Optional[int] = None,
+    engine: Optional[str] = None,
+    progress: Optional[ProgressCallback] = None,
+    stats: Optional[Dict[str, int]] = None,
+    on_chunk: Optional[ChunkCallback] = None,
+) -> List[str]:
+    """
+    Summarizes chunks in batches and returns the summaries in input order.
+
+    Chunks are grouped by their generation settings and sorted by length
+    within each group, so every forward pass pads as little as possible.
+    Chunks summarized before with the same settings are served from the
+    chunk cache; pass a dict as stats to receive chunks_total/chunks_reused.
+    on_chunk receives each summary as soon as it exists, in completion order.
+
+    With SCHEDULER_ENABLED, batching is left to the shared scheduler and
+    batch_size is ignored in favour of INFERENCE_MAX_BATCH.
+    """
+    batch_size = batch_size or config.SUMMARY_BATCH_SIZE
+    cache = get_chunk_cache()
+
+    summaries = [""] * len(chunks)
+    keys: Dict[int, str] = {}
+    groups = defaultdict(list)
+    total = reused = 0
+    for index, chunk in enumerate(chunks):
         if not chunk:
             continue
+        total += 1
+        params = _generation_params(chunk, ratios)
+        if cache is not None:
+            keys[index] = _chunk_key(chunk, *params, engine)
+            cached = cache.get(keys[index])
+            if cached is not None:
+                summaries[index] = cached
+                reused += 1
+                continue
+        groups[params].append(index)
+
+    if on_chunk:
+        for index, summary in enumerate(summaries):
+            if summary:
+                on_chunk(index, total, summary)
 
-        token_len = len(chunk.split())
+    if stats is not None:
+        stats["chunks_total"] = stats.get("chunks_total", 0) + total
+        stats["chunks_reused"] = stats.get("chunks_reused", 0) + reused
 
-        # Define dynamic max and min length for the summary
-        max_len = min(150, int(token_len * max_ratio))
-        min_len = max(30, int(token_len * min_ratio))
+    done = reused
+    if progress and done:
+        progress(done, total)
 
-        if min_len > max_len:
-            min_len = max_len // 2
+    def finish(index: int, summary: str) -> None:
+        summaries[index] = summary
+        if cache is not None:
+            cache.put(keys[index], summary)
+        if on_chunk:
+            on_chunk(index, total, summary)
 
-        result = summarizer(
-            chunk, max_length=max_len, min_length=min_len, do_sample=False
+    if config.SCHEDULER_ENABLED:
+        # Hand every chunk to the shared scheduler, which batches them with
+        # chunks from concurrent requests
+        scheduler = get_scheduler(engine)
+        futures = {
+            scheduler.submit(chunks[i], max_len, min_len): i
+            for (max_len, min_len), indices in groups.items()
+            for i in indices
+        }
+        for future in as_completed(futures):
+            finish(futures[future], future.result())
+            done += 1
+            if progress:
+                progress(done, total)
+        return summaries
+
+    for (max_len, min_len), indices in groups.items():
+        indices.sort(key=lambda i: len(chunks[i]))
+        for start in range(0, len(indices), batch_size):
+            batch = indices[start : start + batch_size]
+            results = _run_pipeline(
+                engine, [chunks[i] for i in batch], max_len, min_len, batch_size
+            )
+            for i, summary in zip(batch, results):
+                finish(i, summary)
+
+            done += len(batch)
+            if progress:
+                progress(done, total)
+
+    return summaries
+
+
+def chunk_token_limit(max_chunk: Optional[int] = None) -> int:
+    """
+    Returns the per-chunk token budget, capped at what the model accepts.
+    """
+    tokenizer = get_tokenizer()
+    model_limit = tokenizer.model_max_length - tokenizer.num_special_tokens_to_add()
+    return min(max_chunk or config.CHUNK_MAX_TOKENS, model_limit)
+
+
+def iter_sentences(pages: Iterable[str]) -> Iterator[str]:
+    for page in pages:
+        yield from split_sentences(page)
+
+
+def make_chunks(
+    sentences: Iterable[str], max_chunk: Optional[int] = None, overlap: Optional[int] = None
+) -> List[str]:
+    """
+    Packs a stream of sentences into chunks using the configured chunking settings.
+    """
+    return list(
+        chunk_sentences(
+            sentences,
+            get_tokenizer(),
+            chunk_token_limit(max_chunk),
+            config.CHUNK_OVERLAP_TOKENS if overlap is None else overlap,
+            config.CHUNK_ANCHOR_MIN_FILL,
+        )
+    )
+
+
+def choose_engine(
+    pages: Sequence[str], summary_length: str, latency_budget_ms: Optional[int] = None
+) -> str:
+    """
+    Policy behind engine="auto": extractive for very large inputs, or when
+    the estimated abstractive time does not fit latency_budget_ms;
+    SUMMARY_ENGINE otherwise.
+    """
+    words = sum(len(page.split()) for page in pages)
+    if words >= config.EXTRACTIVE_AUTO_MIN_WORDS:
+        return EXTRACTIVE
+    if latency_budget_ms is not None:
+        # Roughly 0.75 words per token; good enough for a cost estimate
+        chunks = max(1, int(words / 0.75) // config.CHUNK_MAX_TOKENS + 1)
+        if chunks * config.ABSTRACTIVE_SECONDS_PER_CHUNK * 1000 > latency_budget_ms:
+            return EXTRACTIVE
+    return config.SUMMARY_ENGINE
+
+
+def summarize_text(
+    text: Document,
+    summary_length: str = "medium",
+    max_chunk: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    overlap: Optional[int] = None,
+    engine: Optional[str] = None,
+    mode: str = "concat",
+    progress: Optional[ProgressCallback] = None,
+    stats: Optional[Dict[str, int]] = None,
+    on_chunk: Optional[ChunkCallback] = None,
+    latency_budget_ms: Optional[int] = None,
+) -> str:
+    """
+    Summarizes the given text based on the desired length. text may also be
+    a sequence of page texts, which are streamed into the chunker page by page.
+
+    max_chunk and overlap are measured in model tokens and default to the
+    configured chunking settings. engine selects the inference backend
+    (see app.services.engines) and defaults to SUMMARY_ENGINE; "extractive"
+    selects sentences without running the model, and "auto" picks one via
+    choose_engine using latency_budget_ms. mode is
+    "concat" to join the chunk summaries, or "mapreduce" to summarize them
+    in a process pool and reduce until the result fits summary_length.
+    stats and on_chunk behave as in summarize_chunks.
+    """
+    pages = [text] if isinstance(text, str) else text
+    if engine == AUTO:
+        engine = choose_engine(pages, summary_length, latency_budget_ms)
+    if engine == EXTRACTIVE:
+        return summarize_extractive(pages, target_words(summary_length))
+
+    ratios = get_length_ratios(summary_length)
+    chunks = make_chunks(iter_sentences(pages), max_chunk, overlap)
+
+    if mode == "mapreduce":
+        from app.services.mapreduce_service import summarize_map_reduce
+
+        return summarize_map_reduce(
+            chunks, summary_length, batch_size, engine, progress, stats, on_chunk
+        )
+
+    summary_parts = summarize_chunks(
+        chunks, ratios, batch_size, engine, progress, stats, on_chunk
+    )
+    return " ".join(part for part in summary_parts if part).strip()
+
+
+def count_tokens(text: str) -> int:
+    return len(get_tokenizer().encode(text, add_special_tokens=False))
+
+
+def clean_document(text: Document) -> CleanResult:
+    """
+    Splits a document into pages (a single string may hold form-feed page
+    breaks) and strips repeated headers, footers and duplicate paragraphs
+    when CLEAN_ENABLED is set.
+    """
+    pages = split_pages(text) if isinstance(text, str) else list(text)
+    if not config.CLEAN_ENABLED:
+        return CleanResult(pages=pages)
+    return clean_pages(pages, count_tokens)
+
+
+def _cached(cache, key: str, compute: Callable[[], object]) -> Tuple[object, bool]:
+    """
+    Returns (value, hit), computing and storing the value on a miss.
+    """
+    if cache is None:
+        return compute(), False
+    value = cache.get(key)
+    if value is not None:
+        return value, True
+    value = compute()
+    cache.put(key, value)
+    return value, False
+
+
+def summary_cache_key(
+    digest: Optional[str], summary_length: str, mode: str, engine: Optional[str]
+) -> str:
+    return make_key(
+        "summary",
+        digest,
+        summary_length,
+        mode,
+        config.SUMMARY_MODEL,
+        engine or config.SUMMARY_ENGINE,
+        config.CHUNK_MAX_TOKENS,
+        config.CHUNK_OVERLAP_TOKENS,
+        config.CHUNK_ANCHOR_MIN_FILL,
+        config.CLEAN_ENABLED,
+        config.CACHE_VERSION,
+    )
+
+
+def submit_keywords(text: Document, keyword_engine: Optional[str], digest: Optional[str]) -> Future:
+    """
+    Starts cached keyword extraction in the background. The future resolves
+    to (keywords, cache_hit).
+    """
+    keyword_engine = keyword_engine or config.KEYWORD_ENGINE
+    key = make_key(
+        "keywords",
+        digest,
+        keyword_engine,
+        config.KEYWORD_TOP,
+        config.CLEAN_ENABLED,
+        config.CACHE_VERSION,
+    )
+    return _keyword_executor.submit(
+        _cached, get_result_cache(), key, lambda: extract_keywords(text, keyword_engine)
+    )
+
+
+def summarize_document(
+    text: Document,
+    summary_length: str = "medium",
+    engine: Optional[str] = None,
+    mode: str = "concat",
+    progress: Optional[ProgressCallback] = None,
+    keyword_engine: Optional[str] = None,
+    on_chunk: Optional[ChunkCallback] = None,
+    latency_budget_ms: Optional[int] = None,
+) -> Dict[str, object]:
+    """
+    Runs the full pipeline for one document and returns its summary and keywords.
+    The text is cleaned first (see clean_document) and tokens_removed reports
+    the model tokens that cleaning saved. Keywords are extracted concurrently
+    with the summary.
+
+    Results are cached by the hash of the original text; "cache" in the
+    returned dict tells whether the summary and keywords were cache hits,
+    and chunks_reused counts chunk summaries served from the chunk cache.
+    engine="auto" is resolved up front so the cache key names the engine
+    actually used.
+    """
+    cache = get_result_cache()
+    digest = text_hash(text) if cache else None
+    cleaned = clean_document(text)
+    pages = cleaned.pages
+    if engine == AUTO:
+        engine = choose_engine(pages, summary_length, latency_budget_ms)
+    stats: Dict[str, int] = {}
+
+    def compute_summary():
+        summary = summarize_text(
+            pages,
+            summary_length,
+            engine=engine,
+            mode=mode,
+            progress=progress,
+            stats=stats,
+            on_chunk=on_chunk,
         )
-        if result and isinstance(result, list):
-            summary_parts.append(result[0]["summary_text"])
+        return {
+            "summary": summary,
+            "chunks_total": stats.get("chunks_total", 0),
+            "tokens_removed": cleaned.tokens_removed,
+        }
+
+    keywords_future = submit_keywords(pages, keyword_engine, digest)
+    summary, summary_hit = _cached(
+        cache, summary_cache_key(digest, summary_length, mode, engine), compute_summary
+    )
+    keywords, keywords_hit = keywords_future.result()
 
-    return " ".join(summary_parts).strip()
\ No newline at end of file
+    chunks_total = summary["chunks_total"]
+    # A whole-document hit reuses every chunk
+    chunks_reused = chunks_total if summary_hit else stats.get("chunks_reused", 0)
+    return {
+        "summary": summary["summary"],
+        "keywords": keywords,
+        "chunks_total": chunks_total,
+        "chunks_reused": chunks_reused,
+        "tokens_removed": summary.get("tokens_removed", 0),
+        "cache": {"summary": summary_hit, "keywords": keywords_hit},
+    }
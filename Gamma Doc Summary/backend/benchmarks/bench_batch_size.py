@@ -0,0 +1,63 @@
+"""
+Measures summarization throughput against pipeline batch size on CPU.
+
+Run from the backend directory:
+    python -m benchmarks.bench_batch_size --chunks 64 --batch-sizes 1 2 4 8 16
+"""
+import argparse
+import random
+import time
+
+import torch
+
+from app.core import config
+from app.services.chunker import split_sentences
+from app.services.summarizer_service import make_chunks, summarize_text
+
+WORDS = (
+    "the committee reviewed quarterly revenue targets and agreed that regional "
+    "teams should report progress on customer retention policy changes before "
+    "the next planning cycle while finance prepares an updated forecast"
+).split()
+
+
+def make_document(num_chunks: int, seed: int = 0) -> str:
+    """Builds a synthetic document that chunks into roughly num_chunks chunks."""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(num_chunks * 40):
+        lines.append(" ".join(rng.choice(WORDS) for _ in range(rng.randint(12, 22))) + ".")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chunks", type=int, default=32)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--threads", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+
+    # Measure inference, not cache hits, at the given batch sizes rather
+    # than the scheduler's
+    config.CACHE_ENABLED = False
+    config.SCHEDULER_ENABLED = False
+
+    text = make_document(args.chunks)
+    num_chunks = len(make_chunks(split_sentences(text)))
+    print(f"{num_chunks} chunks")
+    # Warm up once so the first measurement does not include lazy setup
+    summarize_text(text[:2000], batch_size=1)
+
+    print(f"{'batch_size':>10} {'seconds':>10} {'chunks/s':>10}")
+    for batch_size in args.batch_sizes:
+        start = time.perf_counter()
+        summarize_text(text, batch_size=batch_size)
+        elapsed = time.perf_counter() - start
+        print(f"{batch_size:>10} {elapsed:>10.2f} {num_chunks / elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Compares summarization engines on the fixed corpus: load time, latency,
+throughput, peak memory and ROUGE drift against the fp32 PyTorch output.
+
+Each engine runs in its own interpreter so peak memory is not shared.
+Run from the backend directory:
+    python -m benchmarks.bench_engines --engines pytorch int8 onnx
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+from benchmarks.corpus import load_corpus
+from benchmarks.metrics import peak_rss_mb, rouge_1, rouge_l
+
+
+def run_engine(engine: str, summary_length: str) -> dict:
+    """Benchmarks one engine in this process and returns its measurements."""
+    from app.core import config
+    from app.services.summarizer_service import get_summarizer, summarize_text
+
+    # Measure inference, not cache hits
+    config.CACHE_ENABLED = False
+
+    start = time.perf_counter()
+    get_summarizer(engine)
+    load_seconds = time.perf_counter() - start
+
+    summaries, latencies, words = {}, {}, 0
+    for name, text in load_corpus().items():
+        start = time.perf_counter()
+        summaries[name] = summarize_text(text, summary_length, engine=engine)
+        latencies[name] = time.perf_counter() - start
+        words += len(text.split())
+
+    total = sum(latencies.values())
+    return {
+        "engine": engine,
+        "load_seconds": load_seconds,
+        "latency_seconds": latencies,
+        "words_per_second": words / total if total else 0.0,
+        "peak_rss_mb": peak_rss_mb(),
+        "summaries": summaries,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--engines", nargs="+", default=["pytorch", "int8", "onnx"])
+    parser.add_argument("--summary-length", default="medium")
+    parser.add_argument("--engine", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # Child mode: measure a single engine and print JSON
+    if args.engine:
+        print(json.dumps(run_engine(args.engine, args.summary_length)))
+        return
+
+    results = []
+    for engine in args.engines:
+        proc = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_engines", "--engine", engine,
+             "--summary-length", args.summary_length],
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            print(f"{engine}: failed\n{proc.stderr.strip().splitlines()[-1:]}")
+            continue
+        results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+    baseline = next((r for r in results if r["engine"] == "pytorch"), None)
+    print(f"{'engine':>8} {'load s':>8} {'total s':>8} {'words/s':>9} {'rss MB':>8} {'R-1':>6} {'R-L':>6}")
+    for r in results:
+        r1 = rl = float("nan")
+        if baseline:
+            names = baseline["summaries"]
+            r1 = sum(rouge_1(r["summaries"][n], names[n]) for n in names) / len(names)
+            rl = sum(rouge_l(r["summaries"][n], names[n]) for n in names) / len(names)
+        print(
+            f"{r['engine']:>8} {r['load_seconds']:>8.2f} {sum(r['latency_seconds'].values()):>8.2f} "
+            f"{r['words_per_second']:>9.1f} {r['peak_rss_mb']:>8.0f} {r1:>6.3f} {rl:>6.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
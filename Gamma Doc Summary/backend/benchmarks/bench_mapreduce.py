@@ -0,0 +1,47 @@
+"""
+Measures map-reduce summarization wall-clock time from 1 to N worker
+processes on the largest corpus document.
+
+Run from the backend directory:
+    python -m benchmarks.bench_mapreduce --max-workers 4
+"""
+import argparse
+import os
+import time
+
+from benchmarks.corpus import load_corpus
+from app.core import config
+from app.services import mapreduce_service
+from app.services.summarizer_service import summarize_text
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--document", default="report_large")
+    parser.add_argument("--summary-length", default="medium")
+    args = parser.parse_args()
+
+    # Measure inference, not cache hits; spawned workers read the environment
+    os.environ["CACHE_ENABLED"] = "false"
+    config.CACHE_ENABLED = False
+
+    text = load_corpus()[args.document]
+    baseline = None
+    print(f"{'workers':>7} {'seconds':>9} {'speed-up':>9}")
+    for workers in range(1, args.max_workers + 1):
+        mapreduce_service.get_pool(workers)
+        try:
+            # Untimed pass so worker start-up and model loading are excluded
+            summarize_text(text, args.summary_length, mode="mapreduce")
+            start = time.perf_counter()
+            summarize_text(text, args.summary_length, mode="mapreduce")
+            elapsed = time.perf_counter() - start
+        finally:
+            mapreduce_service.shutdown_pool()
+        baseline = baseline or elapsed
+        print(f"{workers:>7} {elapsed:>9.2f} {baseline / elapsed:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
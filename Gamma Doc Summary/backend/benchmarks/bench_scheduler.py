@@ -0,0 +1,69 @@
+"""
+Measures throughput and p95 latency of concurrent summarize requests with
+and without the micro-batching scheduler, at 1, 8 and 32 clients.
+
+Run from the backend directory:
+    python -m benchmarks.bench_scheduler --requests-per-client 4
+"""
+import argparse
+import statistics
+import threading
+import time
+
+from app.core import config
+from app.services.summarizer_service import summarize_text
+from benchmarks.corpus import synthetic_report
+
+
+def run_clients(clients: int, requests_per_client: int) -> tuple:
+    """Returns (requests/s, p95 latency in seconds)."""
+    latencies = []
+    lock = threading.Lock()
+
+    def client(client_id: int):
+        for n in range(requests_per_client):
+            # Distinct short documents: one chunk each, no cache reuse
+            text = synthetic_report(12, seed=client_id * 1000 + n)
+            start = time.perf_counter()
+            summarize_text(text, "short")
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else latencies[0]
+    return len(latencies) / elapsed, p95
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests-per-client", type=int, default=4)
+    parser.add_argument("--max-wait-ms", type=float, default=config.INFERENCE_MAX_WAIT_MS)
+    parser.add_argument("--max-batch", type=int, default=config.INFERENCE_MAX_BATCH)
+    args = parser.parse_args()
+
+    # Measure inference, not cache hits
+    config.CACHE_ENABLED = False
+    config.INFERENCE_MAX_WAIT_MS = args.max_wait_ms
+    config.INFERENCE_MAX_BATCH = args.max_batch
+
+    # Load the model before timing anything
+    summarize_text(synthetic_report(12, seed=-1), "short")
+
+    print(f"{'scheduler':>9} {'clients':>7} {'req/s':>8} {'p95 s':>8}")
+    for enabled in (False, True):
+        config.SCHEDULER_ENABLED = enabled
+        for clients in args.clients:
+            throughput, p95 = run_clients(clients, args.requests_per_client)
+            print(f"{'on' if enabled else 'off':>9} {clients:>7} {throughput:>8.2f} {p95:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
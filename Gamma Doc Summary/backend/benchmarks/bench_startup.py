@@ -0,0 +1,49 @@
+"""
+Measures import time of the summarizer service and time until the backend
+reports ready.
+
+Run from the backend directory:
+    python -m benchmarks.bench_startup
+"""
+import subprocess
+import sys
+
+IMPORT_SNIPPET = """
+import time
+start = time.perf_counter()
+import app.services.summarizer_service
+print(time.perf_counter() - start)
+"""
+
+MAIN_SNIPPET = """
+import time
+start = time.perf_counter()
+import main
+print(time.perf_counter() - start)
+"""
+
+WARM_UP_SNIPPET = """
+import time
+from app.services import summarizer_service
+start = time.perf_counter()
+summarizer_service.warm_up()
+print(time.perf_counter() - start)
+"""
+
+
+def run(snippet: str) -> float:
+    """Runs a snippet in a fresh interpreter and returns the seconds it printed."""
+    output = subprocess.run(
+        [sys.executable, "-c", snippet], check=True, capture_output=True, text=True
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def main():
+    print(f"import summarizer_service: {run(IMPORT_SNIPPET):.3f}s")
+    print(f"import main (app startup): {run(MAIN_SNIPPET):.3f}s")
+    print(f"warm_up (model ready):     {run(WARM_UP_SNIPPET):.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Compares two benchmark result files and flags regressions.
+
+    python -m benchmarks.compare baseline.json candidate.json --time-tolerance 0.1
+
+Exits with status 1 when any metric regresses beyond its tolerance.
+"""
+import argparse
+import json
+import sys
+from typing import List, Tuple
+
+
+def compare(baseline: dict, candidate: dict, time_tolerance: float, memory_tolerance: float,
+            rouge_tolerance: float) -> Tuple[List[str], List[str]]:
+    """Returns (report lines, regression lines)."""
+    lines, regressions = [], []
+
+    def check(label: str, old: float, new: float, higher_is_worse: bool, tolerance: float, relative: bool):
+        change = (new - old) / old if relative and old else new - old
+        worse = change > tolerance if higher_is_worse else change < -tolerance
+        unit = "%" if relative else ""
+        shown = change * 100 if relative else change
+        line = f"{label:<40} {old:>10.3f} {new:>10.3f} {shown:>+9.2f}{unit}"
+        lines.append(line + ("  REGRESSION" if worse else ""))
+        if worse:
+            regressions.append(line)
+
+    check("peak_rss_mb", baseline["peak_rss_mb"], candidate["peak_rss_mb"], True, memory_tolerance, True)
+    for name, old in baseline["documents"].items():
+        new = candidate["documents"].get(name)
+        if new is None:
+            lines.append(f"{name}: missing from candidate")
+            continue
+        for stage, seconds in old["seconds"].items():
+            check(f"{name}.{stage}_s", seconds, new["seconds"][stage], True, time_tolerance, True)
+        for metric in ("rouge_1", "rouge_l"):
+            if metric in old and metric in new:
+                check(f"{name}.{metric}", old[metric], new[metric], False, rouge_tolerance, False)
+    return lines, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--time-tolerance", type=float, default=0.10, help="Allowed relative slowdown")
+    parser.add_argument("--memory-tolerance", type=float, default=0.10, help="Allowed relative RSS growth")
+    parser.add_argument("--rouge-tolerance", type=float, default=0.02, help="Allowed absolute ROUGE drop")
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.candidate) as f:
+        candidate = json.load(f)
+
+    print(f"baseline {baseline['meta']['commit']} vs candidate {candidate['meta']['commit']}")
+    print(f"{'metric':<40} {'baseline':>10} {'candidate':>10} {'change':>10}")
+    lines, regressions = compare(
+        baseline, candidate, args.time_tolerance, args.memory_tolerance, args.rouge_tolerance
+    )
+    print("\n".join(lines))
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) found.")
+        sys.exit(1)
+    print("\nNo regressions.")
+
+
+if __name__ == "__main__":
+    main()
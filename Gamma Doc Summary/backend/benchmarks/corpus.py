@@ -0,0 +1,111 @@
+"""
+Fixed benchmark corpus: public-domain passages plus seeded synthetic reports.
+"""
+import random
+from typing import Dict
+
+GETTYSBURG = (
+    "Four score and seven years ago our fathers brought forth on this continent, "
+    "a new nation, conceived in Liberty, and dedicated to the proposition that all "
+    "men are created equal. Now we are engaged in a great civil war, testing whether "
+    "that nation, or any nation so conceived and so dedicated, can long endure. We "
+    "are met on a great battle-field of that war. We have come to dedicate a portion "
+    "of that field, as a final resting place for those who here gave their lives that "
+    "that nation might live. It is altogether fitting and proper that we should do "
+    "this. But, in a larger sense, we can not dedicate -- we can not consecrate -- we "
+    "can not hallow -- this ground. The brave men, living and dead, who struggled "
+    "here, have consecrated it, far above our poor power to add or detract. The world "
+    "will little note, nor long remember what we say here, but it can never forget "
+    "what they did here. It is for us the living, rather, to be dedicated here to the "
+    "unfinished work which they who fought here have thus far so nobly advanced. It "
+    "is rather for us to be here dedicated to the great task remaining before us -- "
+    "that from these honored dead we take increased devotion to that cause for which "
+    "they gave the last full measure of devotion -- that we here highly resolve that "
+    "these dead shall not have died in vain -- that this nation, under God, shall have "
+    "a new birth of freedom -- and that government of the people, by the people, for "
+    "the people, shall not perish from the earth."
+)
+
+DECLARATION = (
+    "When in the Course of human events, it becomes necessary for one people to "
+    "dissolve the political bands which have connected them with another, and to "
+    "assume among the powers of the earth, the separate and equal station to which "
+    "the Laws of Nature and of Nature's God entitle them, a decent respect to the "
+    "opinions of mankind requires that they should declare the causes which impel "
+    "them to the separation.\n\n"
+    "We hold these truths to be self-evident, that all men are created equal, that "
+    "they are endowed by their Creator with certain unalienable Rights, that among "
+    "these are Life, Liberty and the pursuit of Happiness. That to secure these "
+    "rights, Governments are instituted among Men, deriving their just powers from "
+    "the consent of the governed. That whenever any Form of Government becomes "
+    "destructive of these ends, it is the Right of the People to alter or to abolish "
+    "it, and to institute new Government, laying its foundation on such principles "
+    "and organizing its powers in such form, as to them shall seem most likely to "
+    "effect their Safety and Happiness. Prudence, indeed, will dictate that "
+    "Governments long established should not be changed for light and transient "
+    "causes; and accordingly all experience hath shewn, that mankind are more "
+    "disposed to suffer, while evils are sufferable, than to right themselves by "
+    "abolishing the forms to which they are accustomed. But when a long train of "
+    "abuses and usurpations, pursuing invariably the same Object evinces a design to "
+    "reduce them under absolute Despotism, it is their right, it is their duty, to "
+    "throw off such Government, and to provide new Guards for their future security."
+)
+
+# Human-written reference summaries for ROUGE; synthetic texts have none
+REFERENCES = {
+    "gettysburg": (
+        "Lincoln says the nation was founded on liberty and equality and is now tested "
+        "by civil war. The living cannot truly consecrate the battlefield; the soldiers "
+        "who died already have. The living should dedicate themselves to finishing their "
+        "work so that government of the people, by the people, for the people survives."
+    ),
+    "declaration": (
+        "A people separating from another should explain why. All men are created equal "
+        "with rights to life, liberty and the pursuit of happiness, and governments get "
+        "their power from the consent of the governed. When a government becomes "
+        "destructive of these rights through a long train of abuses, the people have the "
+        "right and duty to replace it."
+    ),
+}
+
+_SUBJECTS = ["The finance team", "Regional managers", "The steering committee", "Our vendor", "The support group"]
+_VERBS = ["reviewed", "approved", "postponed", "questioned", "expanded"]
+_OBJECTS = [
+    "the quarterly revenue forecast",
+    "the customer retention policy",
+    "the data migration schedule",
+    "the hiring plan for next year",
+    "the updated security guidelines",
+]
+_TAILS = [
+    "after a long discussion.",
+    "pending legal review.",
+    "because of supply delays.",
+    "with minor changes to the budget.",
+    "and asked for a follow-up next week.",
+]
+
+
+def synthetic_report(sentences: int, seed: int = 0) -> str:
+    """Builds a deterministic business-report style text."""
+    rng = random.Random(seed)
+    lines = []
+    for i in range(sentences):
+        lines.append(
+            f"{rng.choice(_SUBJECTS)} {rng.choice(_VERBS)} {rng.choice(_OBJECTS)} {rng.choice(_TAILS)}"
+        )
+        # Paragraph break every few sentences, like extracted PDF text
+        if i % 6 == 5:
+            lines.append("")
+    return "\n".join(lines)
+
+
+def load_corpus() -> Dict[str, str]:
+    """Returns the fixed corpus as name -> text, ordered from small to large."""
+    return {
+        "gettysburg": GETTYSBURG,
+        "declaration": DECLARATION,
+        "report_small": synthetic_report(40, seed=1),
+        "report_medium": synthetic_report(200, seed=2),
+        "report_large": synthetic_report(1000, seed=3),
+    }
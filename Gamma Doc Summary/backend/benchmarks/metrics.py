@@ -0,0 +1,50 @@
+"""
+Small, dependency-free ROUGE and memory helpers shared by the benchmarks.
+"""
+import re
+import resource
+import sys
+from collections import Counter
+from typing import List
+
+_TOKEN = re.compile(r"\w+")
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN.findall(text.lower())
+
+
+def _f1(overlap: int, candidate_len: int, reference_len: int) -> float:
+    if not overlap or not candidate_len or not reference_len:
+        return 0.0
+    precision = overlap / candidate_len
+    recall = overlap / reference_len
+    return 2 * precision * recall / (precision + recall)
+
+
+def rouge_1(candidate: str, reference: str) -> float:
+    """Unigram-overlap F1 between two texts."""
+    cand, ref = _tokens(candidate), _tokens(reference)
+    overlap = sum((Counter(cand) & Counter(ref)).values())
+    return _f1(overlap, len(cand), len(ref))
+
+
+def rouge_l(candidate: str, reference: str) -> float:
+    """Longest-common-subsequence F1 between two texts."""
+    cand, ref = _tokens(candidate), _tokens(reference)
+    if not cand or not ref:
+        return 0.0
+    previous = [0] * (len(ref) + 1)
+    for c in cand:
+        current = [0]
+        for j, r in enumerate(ref):
+            current.append(previous[j] + 1 if c == r else max(previous[j + 1], current[j]))
+        previous = current
+    return _f1(previous[-1], len(cand), len(ref))
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in megabytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
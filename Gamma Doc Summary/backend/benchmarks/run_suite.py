@@ -0,0 +1,114 @@
+"""
+Summarization benchmark suite. Runs every corpus document through the
+pipeline stage by stage and writes machine-readable results.
+
+Run from the backend directory:
+    python -m benchmarks.run_suite --output results/baseline.json
+    python -m benchmarks.compare results/baseline.json results/candidate.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import time
+
+from app.core import config
+from app.services import summarizer_service
+from app.services.chunker import split_sentences
+from benchmarks.corpus import REFERENCES, load_corpus
+from benchmarks.metrics import peak_rss_mb, rouge_1, rouge_l
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def _timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    value = function(*args, **kwargs)
+    return value, time.perf_counter() - start
+
+
+def bench_document(name: str, text: str, summary_length: str, keyword_engine: str) -> dict:
+    """Times chunking, inference and keywords for one document."""
+    ratios = summarizer_service.get_length_ratios(summary_length)
+    chunks, chunk_seconds = _timed(summarizer_service.make_chunks, split_sentences(text))
+    parts, inference_seconds = _timed(summarizer_service.summarize_chunks, chunks, ratios)
+    _, keyword_seconds = _timed(summarizer_service.extract_keywords, text, keyword_engine)
+
+    summary = " ".join(part for part in parts if part)
+    total = chunk_seconds + inference_seconds + keyword_seconds
+    result = {
+        "words": len(text.split()),
+        "chunks": len(chunks),
+        "seconds": {
+            "chunking": chunk_seconds,
+            "inference": inference_seconds,
+            "keywords": keyword_seconds,
+            "total": total,
+        },
+        "words_per_second": len(text.split()) / total if total else 0.0,
+        "summary": summary,
+    }
+    if name in REFERENCES:
+        result["rouge_1"] = rouge_1(summary, REFERENCES[name])
+        result["rouge_l"] = rouge_l(summary, REFERENCES[name])
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--summary-length", default="medium")
+    parser.add_argument("--keyword-engine", default=config.KEYWORD_ENGINE)
+    parser.add_argument("--documents", nargs="*", help="Subset of corpus documents to run")
+    args = parser.parse_args()
+
+    # Every run must do the full work
+    config.CACHE_ENABLED = False
+
+    load_seconds = _timed(summarizer_service.warm_up)[1]
+    corpus = load_corpus()
+    names = args.documents or list(corpus)
+
+    documents = {}
+    for name in names:
+        documents[name] = bench_document(
+            name, corpus[name], args.summary_length, args.keyword_engine
+        )
+        print(f"{name}: {documents[name]['seconds']['total']:.2f}s")
+
+    results = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "model": config.SUMMARY_MODEL,
+            "engine": config.SUMMARY_ENGINE,
+            "summary_length": args.summary_length,
+            "keyword_engine": args.keyword_engine,
+            "scheduler": config.SCHEDULER_ENABLED,
+        },
+        "load_seconds": load_seconds,
+        "peak_rss_mb": peak_rss_mb(),
+        "documents": documents,
+    }
+
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
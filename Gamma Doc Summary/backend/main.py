@@ -1,6 +1,10 @@
+import threading
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from app.api.endpoints import router as api_router
+from app.core import config
+from app.services import keyword_service, mapreduce_service, pdf_service, summarizer_service
 
 app = FastAPI(title="Document Summarizer API")
 
@@ -16,6 +20,47 @@ app.add_middleware(
 # Include the API router
 app.include_router(api_router, prefix="/api/v1")
 
+
+def _warm_up():
+    try:
+        summarizer_service.warm_up()
+        print("Summarizer warm-up completed.")
+    except Exception as e:
+        print(f"Summarizer warm-up failed: {e}")
+
+
+@app.on_event("startup")
+def start_warm_up():
+    # Warm up in the background so the process accepts health checks right away
+    if config.WARM_UP_ON_STARTUP:
+        threading.Thread(target=_warm_up, name="summarizer-warm-up", daemon=True).start()
+
+
+@app.on_event("shutdown")
+def stop_workers():
+    mapreduce_service.shutdown_pool()
+    keyword_service.shutdown_pool()
+    pdf_service.shutdown_pool()
+
+
 @app.get("/")
 def read_root():
     return {"message": "Welcome to the Document Summarizer API"}
+
+
+@app.get("/healthz")
+def healthz():
+    """
+    Liveness probe: the process is up and serving HTTP.
+    """
+    return {"status": "ok"}
+
+
+@app.get("/readyz")
+def readyz():
+    """
+    Readiness probe: the models are loaded and requests will not block on them.
+    """
+    if summarizer_service.is_ready():
+        return {"status": "ready"}
+    return JSONResponse(status_code=503, content={"status": "loading"})
@@ -1,7 +1,10 @@
+import json
 import streamlit as st
 import requests
 from pdf_utils import extract_text_from_pdf
 
+BACKEND_URL = "http://localhost:8000/api/v1"
+
 # Page configuration
 st.set_page_config(
     page_title="Gama Document Summarizer",
@@ -11,21 +14,66 @@ st.set_page_config(
 )
 
 
-def get_summary(text: str, length: str):
+def stream_summary(text: str, length: str):
+    """
+    Yields events from the streaming endpoint: one per chunk summary, then a
+    final event with "done", the full summary and the keywords.
+    """
+    response = requests.post(
+        f"{BACKEND_URL}/summarize/stream",
+        json={"text": text, "summary_length": length.lower()},
+        stream=True,
+        timeout=(10, None),
+    )
+    response.raise_for_status()
+
+    for line in response.iter_lines():
+        if not line:
+            continue
+        line_str = line.decode("utf-8")
+        if not line_str.startswith("data: "):
+            continue
+        try:
+            yield json.loads(line_str[6:])
+        except json.JSONDecodeError:
+            continue
+
+
+def render_streamed_summary(text: str, length: str):
     """
-    Sends text to the backend API and returns the summary and keywords.
+    Shows each section as soon as the backend finishes it, in document order.
+    Returns (summary, keywords), or (None, []) on failure.
     """
+    st.subheader("📝 Summary")
+    status = st.empty()
+    sections = st.container()
+    placeholders = {}
+    received = 0
+
     try:
-        response = requests.post(
-            "http://localhost:8000/api/v1/summarize",
-            json={"text": text, "summary_length": length.lower()},
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("summary", ""), data.get("keywords", [])
+        for event in stream_summary(text, length):
+            if "error" in event:
+                st.error(event["error"])
+                return None, []
+            if event.get("done"):
+                status.empty()
+                if not placeholders and event.get("summary"):
+                    sections.success(event["summary"])
+                if event.get("tokens_removed"):
+                    st.caption(
+                        f"Skipped {event['tokens_removed']} tokens of repeated headers, footers and duplicate text."
+                    )
+                return event.get("summary", ""), event.get("keywords", [])
+
+            total = event["chunks_total"]
+            if not placeholders:
+                placeholders = {i: sections.empty() for i in range(total)}
+            placeholders[event["index"]].success(event["summary"])
+            received += 1
+            status.caption(f"Summarized {received} of {total} sections...")
     except requests.exceptions.RequestException as e:
         st.error(f"Error connecting to the backend: {e}")
-        return None, []
+    return None, []
 
 
 def main():
@@ -85,12 +133,9 @@ def main():
             st.text_area("Extracted Text", extracted_text, height=250)
 
         if st.button("✨ Summarize Document"):
-            with st.spinner("Generating summary... Please wait."):
-                summary, keywords = get_summary(extracted_text, summary_length)
+            with st.spinner("Generating summary..."):
+                summary, keywords = render_streamed_summary(extracted_text, summary_length)
                 if summary:
-                    st.subheader("📝 Summary")
-                    st.success(summary)
-
                     st.subheader("🔑 Keywords")
                     st.write(", ".join(f"`{kw}`" for kw in keywords))
 
@@ -1,8 +1,9 @@
 import fitz  # PyMuPDF
 
+# Form feed between pages lets the backend spot repeated headers and footers
+PAGE_BREAK = "\f"
+
+
 def extract_text_from_pdf(file):
     pdf = fitz.open(stream=file.read(), filetype="pdf")
-    text = ""
-    for page in pdf:
-        text += page.get_text()
-    return text
+    return PAGE_BREAK.join(page.get_text() for page in pdf)
@@ -0,0 +1,126 @@
+"""
+Micro-benchmark of heuristic_extract against the original multi-pass
+implementation on synthetic transcripts of 10k to 200k sentences. Each run
+also checks that both produce the same output.
+
+Run from the backend directory:
+    python -m benchmarks.bench_heuristic_extract --sizes 10000 50000 200000
+"""
+import argparse
+import random
+import re
+import time
+from typing import Any, Dict
+
+from heuristics import heuristic_extract
+
+NAMES = ["Alice", "Bob", "Priya", "Chen", "Maria", "Tom"]
+FILLER = (
+    "the customer dashboard numbers looked steady this week and the team "
+    "reviewed several tickets from support about login delays on mobile devices"
+).split()
+TEMPLATES = [
+    "{name}: I'll take the {word} report.",
+    "{name} will send the {word} summary tomorrow.",
+    "We decided to move the {word} launch to Friday.",
+    "TODO: check the {word} metrics.",
+    "Action: {name} to update the {word} docs.",
+    "Please review the {word} budget before the deadline.",
+    "Follow up with {name} about the {word} risk.",
+    "The next step is planning the {word} rollout.",
+    "Is the {word} problem fixed?",
+    "{name}: Sounds good, thanks!",
+]
+
+
+def synthetic_transcript(sentences: int, seed: int = 0) -> str:
+    """Mostly filler chatter with a template sentence every few lines."""
+    rng = random.Random(seed)
+    parts = []
+    for _ in range(sentences):
+        if rng.random() < 0.3:
+            template = rng.choice(TEMPLATES)
+            parts.append(template.format(name=rng.choice(NAMES), word=rng.choice(FILLER)))
+        else:
+            words = rng.sample(FILLER, rng.randint(6, 14))
+            parts.append(" ".join(words).capitalize() + rng.choice(".!?"))
+    return " ".join(parts)
+
+
+def legacy_heuristic_extract(transcript: str) -> Dict[str, Any]:
+    """The original implementation, kept as the reference for speed and output."""
+    sentences = re.split(r"(?<=[.!?])\s+", transcript)
+    summary = " ".join(sentences[:2]).strip()
+
+    keywords = ["decide", "decided", "decision", "plan", "problem", "risk", "next", "update", "deadline"]
+    key_points = []
+    for s in sentences:
+        sl = s.lower()
+        if len(s) < 250 and any(k in sl for k in keywords):
+            key_points.append(s.strip())
+    if not key_points:
+        key_points = [s.strip() for s in sentences if s.strip()][:4]
+
+    action_patterns = [r"todo[:\-]?\s*(.*)", r"action[:\-]?\s*(.*)", r"follow up with (.*?)[:\-]?(.*)", r"(?i)(assign|will|we will|please|please\s+check)\s+(.*)"]
+    action_items = []
+    for s in sentences:
+        for pat in action_patterns:
+            m = re.search(pat, s, flags=re.IGNORECASE)
+            if m:
+                task_text = (m.group(1) if m.groups() else s).strip()
+                if not task_text:
+                    task_text = s.strip()
+                assignee = None
+                name_m = re.search(r"([A-Z][a-z]+)\s*(?:will|to|:\s)", s)
+                if name_m:
+                    assignee = name_m.group(1)
+                action_items.append({"task": task_text, "assignee": assignee, "due": None, "context": s.strip()})
+
+    for s in sentences:
+        colon = s.split(":", 1)
+        if len(colon) == 2 and len(colon[0].split()) <= 3:
+            speaker = colon[0].strip()
+            body = colon[1].strip()
+            if re.search(r"(I'll|I will|I'll take|I'll do|I will take|assign|take care|action)", body, flags=re.IGNORECASE):
+                action_items.append({"task": body, "assignee": speaker, "due": None, "context": s.strip()})
+
+    seen = set()
+    unique_actions = []
+    for a in action_items:
+        key = a["task"]
+        if key not in seen:
+            seen.add(key)
+            unique_actions.append(a)
+
+    return {
+        "summary": summary,
+        "key_points": key_points,
+        "action_items": unique_actions,
+    }
+
+
+def timed(fn, transcript: str):
+    start = time.perf_counter()
+    result = fn(transcript)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000, 200000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'sentences':>9} {'legacy s':>9} {'compiled s':>10} {'speed-up':>9} {'same':>5}")
+    for size in args.sizes:
+        transcript = synthetic_transcript(size, args.seed)
+        legacy_seconds, expected = timed(legacy_heuristic_extract, transcript)
+        seconds, result = timed(heuristic_extract, transcript)
+        same = result == expected
+        print(f"{size:>9} {legacy_seconds:>9.3f} {seconds:>10.3f} {legacy_seconds / seconds:>8.2f}x {str(same):>5}")
+        if not same:
+            raise SystemExit("Outputs differ")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Runs map-reduce LLM extraction against a stand-in server on localhost, so the
+pipeline can be checked and timed offline without calling a real model.
+
+The stand-in answers both endpoint styles (/chat/completions and Ollama's
+/api/chat) after --latency-ms, with fixed notes that repeat across chunks.
+Each run reports requests made, the most in flight at once and wall-clock
+time, and checks that chunks were merged and deduplicated.
+
+Run from the backend directory:
+    python -m benchmarks.bench_llm_extract --sentences 2000 --chunk-tokens 500 --concurrency 1 4 8
+"""
+import argparse
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import llm_extract
+from benchmarks.bench_heuristic_extract import synthetic_transcript
+
+MAP_REPLY = {
+    "summary": "The team reviewed this part of the meeting.",
+    "key_points": ["Launch moved to Friday", "launch moved to Friday."],
+    "action_items": [
+        {"task": "Send the budget summary", "assignee": None},
+        {"task": "send the budget summary.", "assignee": "Bob", "due": "Friday"},
+    ],
+}
+REDUCE_REPLY = {
+    "summary": "The team moved the launch and assigned follow-ups.",
+    "key_points": ["Launch moved to Friday", "Budget summary due"],
+}
+
+
+class StandIn(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latency: float):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.requests = self.in_flight = self.max_in_flight = 0
+
+    def reset(self) -> None:
+        self.requests = self.in_flight = self.max_in_flight = 0
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.requests += 1
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        time.sleep(server.latency)
+        with server.lock:
+            server.in_flight -= 1
+
+        reduce_step = "notes on consecutive parts" in body["messages"][0]["content"]
+        content = json.dumps(REDUCE_REPLY if reduce_step else MAP_REPLY)
+        if self.path == "/api/chat":
+            reply = {"message": {"role": "assistant", "content": content}, "done": True}
+        elif self.path == "/chat/completions":
+            reply = {"choices": [{"message": {"role": "assistant", "content": content}}]}
+        else:
+            self.send_error(404)
+            return
+        data = json.dumps(reply).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sentences", type=int, default=2000)
+    parser.add_argument("--chunk-tokens", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--styles", nargs="+", default=["openai", "ollama"])
+    args = parser.parse_args()
+
+    server = StandIn(args.latency_ms / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    transcript = synthetic_transcript(args.sentences)
+    chunks = len(llm_extract.chunk_transcript(transcript, args.chunk_tokens))
+    print(f"{chunks} chunks")
+
+    llm_extract.LLM_BASE_URL = f"http://127.0.0.1:{server.server_port}"
+    llm_extract.LLM_API_KEY = "stand-in"
+    llm_extract.LLM_CHUNK_TOKENS = args.chunk_tokens
+    try:
+        print(f"{'style':>7} {'concurrency':>11} {'requests':>9} {'in flight':>9} {'seconds':>8}")
+        for style in args.styles:
+            llm_extract.LLM_API_STYLE = style
+            for concurrency in args.concurrency:
+                llm_extract.LLM_CONCURRENCY = concurrency
+                server.reset()
+                start = time.perf_counter()
+                result = asyncio.run(llm_extract.extract_structured_with_llm(transcript))
+                elapsed = time.perf_counter() - start
+                print(
+                    f"{style:>7} {concurrency:>11} {server.requests:>9} "
+                    f"{server.max_in_flight:>9} {elapsed:>8.2f}"
+                )
+                if server.max_in_flight > concurrency:
+                    raise SystemExit("More requests in flight than the concurrency limit")
+                expected = REDUCE_REPLY if chunks > 1 else MAP_REPLY
+                if result["summary"] != expected["summary"] or len(result["action_items"]) != 1:
+                    raise SystemExit(f"Unexpected result: {result}")
+                if result["action_items"][0]["assignee"] != "Bob":
+                    raise SystemExit("Duplicate action items were not merged")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Measures wall-clock time of VAD-chunked parallel transcription from 1 to N
+worker processes on a synthetic long recording, against a single
+sequential faster-whisper pass.
+
+The recording repeats --audio (a short real speech sample gives meaningful
+numbers) with a second of silence between copies until it is --minutes long.
+Without --audio, bursts of modulated noise separated by silences stand in
+for speech; the timings then reflect decoding cost, not transcript quality.
+
+Run from the backend directory:
+    python -m benchmarks.bench_parallel_transcribe --audio sample.wav --minutes 30 --max-workers 4
+"""
+import argparse
+import os
+import tempfile
+import time
+import wave
+
+import numpy as np
+from faster_whisper import WhisperModel, decode_audio
+
+import parallel_transcribe
+from parallel_transcribe import SAMPLE_RATE
+
+
+def synthetic_speech(seconds: float, seed: int = 0) -> np.ndarray:
+    """Noise bursts of 3-15 s, amplitude-modulated at syllable rate, with 0.6-2 s silences."""
+    rng = np.random.default_rng(seed)
+    parts, total = [], 0.0
+    while total < seconds:
+        burst = rng.uniform(3, 15)
+        t = np.arange(int(burst * SAMPLE_RATE)) / SAMPLE_RATE
+        envelope = 0.5 * (1 + np.sin(2 * np.pi * rng.uniform(3, 6) * t))
+        parts.append((0.3 * envelope * rng.standard_normal(t.size)).astype(np.float32))
+        silence = rng.uniform(0.6, 2.0)
+        parts.append(np.zeros(int(silence * SAMPLE_RATE), dtype=np.float32))
+        total += burst + silence
+    return np.concatenate(parts)
+
+
+def tiled(sample: np.ndarray, seconds: float) -> np.ndarray:
+    gap = np.zeros(SAMPLE_RATE, dtype=np.float32)
+    copies = int(seconds * SAMPLE_RATE // (sample.size + gap.size)) + 1
+    return np.concatenate([np.concatenate([sample, gap])] * copies)[: int(seconds * SAMPLE_RATE)]
+
+
+def write_wav(path: str, audio: np.ndarray) -> None:
+    with wave.open(path, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes((np.clip(audio, -1, 1) * 32767).astype(np.int16).tobytes())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--audio", help="Speech sample to repeat (any format ffmpeg reads)")
+    parser.add_argument("--minutes", type=float, default=20)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--model", default="tiny")
+    parser.add_argument("--compute-type", default="int8")
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--skip-sequential", action="store_true")
+    args = parser.parse_args()
+
+    seconds = args.minutes * 60
+    if args.audio:
+        audio = tiled(decode_audio(args.audio, sampling_rate=SAMPLE_RATE), seconds)
+    else:
+        audio = synthetic_speech(seconds)
+
+    with tempfile.TemporaryDirectory(prefix="bench-") as tmpdir:
+        path = os.path.join(tmpdir, "recording.wav")
+        write_wav(path, audio)
+        print(f"Recording: {seconds / 60:.0f} min, model {args.model} ({args.compute_type})")
+
+        if not args.skip_sequential:
+            model = WhisperModel(args.model, device="cpu", compute_type=args.compute_type)
+            start = time.perf_counter()
+            segments, _ = model.transcribe(path, beam_size=5, language=args.language)
+            count = sum(1 for _ in segments)
+            print(f"sequential: {time.perf_counter() - start:.2f} s, {count} segments")
+            del model
+
+        baseline = None
+        print(f"{'workers':>7} {'seconds':>9} {'speed-up':>9} {'segments':>9}")
+        for workers in range(1, args.max_workers + 1):
+            pool = parallel_transcribe.get_pool(workers)
+            try:
+                # Untimed concurrent tasks so every worker starts and loads its
+                # model before timing
+                clip = audio[: 5 * SAMPLE_RATE]
+                for future in [
+                    pool.submit(
+                        parallel_transcribe._transcribe_window,
+                        clip, 0.0, args.model, args.compute_type, args.language,
+                    )
+                    for _ in range(workers)
+                ]:
+                    future.result()
+                start = time.perf_counter()
+                count = sum(1 for _ in parallel_transcribe.iter_segments_parallel(
+                    path, args.model, args.compute_type, args.language
+                ))
+                elapsed = time.perf_counter() - start
+            finally:
+                parallel_transcribe.shutdown_pool()
+            baseline = baseline or elapsed
+            print(f"{workers:>7} {elapsed:>9.2f} {baseline / elapsed:>9.2f}x {count:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Rule-based extraction of summary, key points and action items, used when no
+LLM is configured or requested.
+
+All patterns are compiled once. A single scan of the transcript finds the
+key-point keywords, the action-item trigger words and speaker colons; only
+sentences with a hit are processed further, and each action pattern only
+runs on sentences containing its trigger. The output is the same as the
+original multi-pass extractor.
+"""
+
+import re
+from bisect import bisect_right
+from collections import defaultdict
+from typing import Any, Dict, List
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+
+KEYWORDS = ["decide", "decided", "decision", "plan", "problem", "risk", "next", "update", "deadline"]
+
+# The action patterns, in the order they are tried, each with the trigger
+# word(s) it cannot match without
+ACTION_PATTERNS = [
+    ("todo", re.compile(r"todo[:\-]?\s*(.*)", re.IGNORECASE)),
+    ("action", re.compile(r"action[:\-]?\s*(.*)", re.IGNORECASE)),
+    ("follow", re.compile(r"follow up with (.*?)[:\-]?(.*)", re.IGNORECASE)),
+    ("assign", re.compile(r"(?i)(assign|will|we will|please|please\s+check)\s+(.*)", re.IGNORECASE)),
+]
+
+# One scan over the whole transcript finds every keyword, trigger word and
+# colon; sentences without a hit are never looked at again. Where the end of
+# a word can start another ("nextodo", "actionext", "decideadline"), only the
+# part before the overlap is consumed and the rest is a lookahead, so no
+# occurrence is skipped. Matches never contain sentence-ending punctuation,
+# so each lies inside one sentence. Capturing groups make the scan several
+# times slower, so the matched text is mapped to its kind afterwards.
+_SCAN_WORDS = [
+    # (kind, consumed text, lookahead)
+    ("keyword", "deci", "de"), ("keyword", "decisio", "n"), ("keyword", "pla", "n"),
+    ("keyword", "problem", ""), ("keyword", "risk", ""), ("keyword", "nex", "t"),
+    ("keyword", "update", ""), ("keyword", "deadli", "ne"),
+    ("todo", "todo", ""), ("action", "actio", "n"), ("follow", "follow up with", ""),
+    ("assign", "assig", "n"), ("assign", "will", ""), ("assign", "please", ""),
+    ("colon", ":", ""),
+]
+
+
+def _alternatives(kind=None) -> str:
+    return "|".join(
+        re.escape(text) + (f"(?={ahead})" if ahead else "")
+        for k, text, ahead in _SCAN_WORDS if kind in (None, k)
+    )
+
+
+_SCAN_KIND = {text: kind for kind, text, _ in _SCAN_WORDS}
+# ASCII transcripts are lowercased first (offsets stay the same) and scanned
+# case-sensitively. Other transcripts keep IGNORECASE, which also matches
+# e.g. "ſ" for "s", and there the kind comes from a named group instead
+_SCAN = re.compile(_alternatives())
+_SCAN_IGNORECASE = re.compile(
+    "|".join(f"(?P<{kind}>{_alternatives(kind)})" for kind in dict.fromkeys(_SCAN_KIND.values())),
+    re.IGNORECASE,
+)
+
+# Key-point keywords are substring matches on the lowercased sentence; outside
+# ASCII, lower() and IGNORECASE can disagree (e.g. "ſ", the Kelvin sign), so
+# such transcripts are checked sentence by sentence instead
+_KEYWORD = re.compile("|".join(KEYWORDS))
+
+_NAME = re.compile(r"([A-Z][a-z]+)\s*(?:will|to|:\s)")
+_SPEAKER_COMMITMENT = re.compile(
+    r"(I'll|I will|I'll take|I'll do|I will take|assign|take care|action)", re.IGNORECASE
+)
+
+KEY_POINT_MAX_CHARS = 250
+
+
+def _action_items(sentence: str, triggers: set) -> List[Dict[str, Any]]:
+    items = []
+    context = None
+    assignee = None
+    for trigger, pattern in ACTION_PATTERNS:
+        if trigger not in triggers:
+            continue
+        m = pattern.search(sentence)
+        if not m:
+            continue
+        if context is None:
+            context = sentence.strip()
+            name_match = _NAME.search(sentence)
+            assignee = name_match.group(1) if name_match else None
+        task_text = (m.group(1) if m.groups() else sentence).strip()
+        if not task_text:
+            task_text = context
+        items.append({"task": task_text, "assignee": assignee, "due": None, "context": context})
+    return items
+
+
+def heuristic_extract(transcript: str) -> Dict[str, Any]:
+    """A simple rule-based extractor for summary, key points and action items."""
+    # Split into sentences, keeping the offset where each starts to map scan
+    # hits back to sentences
+    sentences = []
+    starts = [0]
+    for m in _SENTENCE_SPLIT.finditer(transcript):
+        sentences.append(transcript[starts[-1]:m.start()])
+        starts.append(m.end())
+    sentences.append(transcript[starts[-1]:])
+    # summary: first 2 sentences (fallback)
+    summary = " ".join(sentences[:2]).strip()
+
+    hits: Dict[int, set] = defaultdict(set)
+    is_ascii = transcript.isascii()
+    if is_ascii:
+        for m in _SCAN.finditer(transcript.lower()):
+            hits[bisect_right(starts, m.start()) - 1].add(_SCAN_KIND[m.group()])
+    else:
+        for m in _SCAN_IGNORECASE.finditer(transcript):
+            hits[bisect_right(starts, m.start()) - 1].add(m.lastgroup)
+
+    if is_ascii:
+        keyword_sentences = [i for i in sorted(hits) if "keyword" in hits[i]]
+    else:
+        keyword_sentences = [
+            i for i, s in enumerate(sentences)
+            if len(s) < KEY_POINT_MAX_CHARS and _KEYWORD.search(s.lower())
+        ]
+    key_points = [sentences[i].strip() for i in keyword_sentences if len(sentences[i]) < KEY_POINT_MAX_CHARS]
+    # if none found, pick top 4 non-empty sentences
+    if not key_points:
+        key_points = [s.strip() for s in sentences if s.strip()][:4]
+
+    action_items = []
+    speaker_items = []
+    for i in sorted(hits):
+        s = sentences[i]
+        found = hits[i]
+        triggers = found - {"keyword", "colon"}
+        if triggers:
+            action_items.extend(_action_items(s, triggers))
+
+        # lines like "Alice: I'll take X"
+        if "colon" in found:
+            speaker, body = s.split(":", 1)
+            if len(speaker.split()) <= 3:
+                body = body.strip()
+                if _SPEAKER_COMMITMENT.search(body):
+                    speaker_items.append({"task": body, "assignee": speaker.strip(), "due": None, "context": s.strip()})
+
+    # dedupe; pattern matches come before speaker lines
+    seen = set()
+    unique_actions = []
+    for a in action_items + speaker_items:
+        key = a["task"]
+        if key not in seen:
+            seen.add(key)
+            unique_actions.append(a)
+
+    return {
+        "summary": summary,
+        "key_points": key_points,
+        "action_items": unique_actions,
+    }
@@ -0,0 +1,296 @@
+"""
+LLM extraction of summary, key points and action items, map-reduce style so
+long meetings fit the model's context.
+
+The transcript is cut at sentence boundaries into chunks of about
+LLM_CHUNK_TOKENS. Each chunk is sent to the model concurrently (at most
+LLM_CONCURRENCY requests in flight) for its own notes and action items. The
+action items are merged and deduplicated locally; the chunk summaries and
+key points are combined by further model calls, in groups that fit the
+budget, until one summary is left.
+
+Two endpoint styles are supported:
+- "openai": any OpenAI-compatible /chat/completions endpoint (OpenAI, vLLM,
+  llama.cpp server, Ollama's /v1).
+- "ollama": Ollama's native /api/chat, e.g.
+    LLM_API_STYLE=ollama LLM_MODEL=llama3.1 (base URL defaults to http://localhost:11434)
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except Exception:
+    HAS_HTTPX = False
+
+logger = logging.getLogger("meeting-extractor")
+
+LLM_API_STYLE = os.getenv("LLM_API_STYLE", "openai")
+LLM_BASE_URL = os.getenv(
+    "LLM_BASE_URL", "http://localhost:11434" if LLM_API_STYLE == "ollama" else "https://api.openai.com/v1"
+)
+LLM_API_KEY = os.getenv("LLM_API_KEY", os.getenv("OPENAI_API_KEY", ""))
+LLM_MODEL = os.getenv("LLM_MODEL", os.getenv("OPENAI_MODEL", "gpt-4o-mini"))
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "120"))
+
+# Transcript tokens per map request, output tokens per request, and how many
+# requests run at once
+LLM_CHUNK_TOKENS = int(os.getenv("LLM_CHUNK_TOKENS", "3000"))
+LLM_MAX_OUTPUT_TOKENS = int(os.getenv("LLM_MAX_OUTPUT_TOKENS", "700"))
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "4"))
+
+# Rough token count without a tokenizer; English averages about 4 characters per token
+CHARS_PER_TOKEN = 4
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+_WORD = re.compile(r"\w+")
+
+MAP_PROMPT = """
+You are an assistant that extracts structured meeting notes from a meeting transcript.
+Below is part {part} of {parts} of the transcript. Produce a JSON object with fields:
+- summary: 1-3 sentence concise summary of this part
+- key_points: array of up to 6 bullet points (short phrases)
+- action_items: array of objects with fields: task, assignee (optional), due (optional), context (optional)
+The transcript part:
+---
+{text}
+---
+Return only valid JSON.
+"""
+
+SINGLE_PROMPT = """
+You are an assistant that extracts structured meeting notes from a meeting transcript.
+Given the transcript below, produce a JSON object with fields:
+- summary: 2-4 sentence concise summary
+- key_points: array of 3-8 bullet points (short phrases)
+- action_items: array of objects with fields: task, assignee (optional), due (optional), context (optional)
+The transcript:
+---
+{text}
+---
+Return only valid JSON.
+"""
+
+REDUCE_PROMPT = """
+You are an assistant that writes meeting notes. Below are notes on consecutive parts of one meeting.
+Combine them into a JSON object with fields:
+- summary: 2-4 sentence concise summary of the whole meeting
+- key_points: array of 3-8 bullet points (short phrases), merging duplicates
+The notes:
+---
+{text}
+---
+Return only valid JSON.
+"""
+
+
+def is_configured() -> bool:
+    """An API key, or an explicitly set endpoint (local servers need no key)."""
+    return HAS_HTTPX and bool(LLM_API_KEY or os.getenv("LLM_BASE_URL") or LLM_API_STYLE == "ollama")
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def chunk_transcript(transcript: str, max_tokens: int) -> List[str]:
+    """Consecutive sentences packed into chunks of at most max_tokens; longer sentences are cut at words."""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    pieces = []
+    for sentence in _SENTENCE_SPLIT.split(transcript.strip()):
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            pieces.append(sentence[:cut])
+            sentence = sentence[cut:].lstrip()
+        if sentence:
+            pieces.append(sentence)
+
+    chunks, current, size = [], [], 0
+    for piece in pieces:
+        if current and size + len(piece) + 1 > max_chars:
+            chunks.append(" ".join(current))
+            current, size = [], 0
+        current.append(piece)
+        size += len(piece) + 1
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+def extract_json_block(text: str) -> Optional[str]:
+    """Extract the first JSON object or array from a string."""
+    # naive approach: find first { and last matching }
+    start = text.find("{")
+    end = text.rfind("}")
+    if start != -1 and end != -1 and end > start:
+        return text[start:end+1]
+    # try array
+    start = text.find("[")
+    end = text.rfind("]")
+    if start != -1 and end != -1 and end > start:
+        return text[start:end+1]
+    return None
+
+
+def _normalize(text: str) -> str:
+    return " ".join(_WORD.findall(text.lower()))
+
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def merge_key_points(lists: List[List[Any]]) -> List[str]:
+    seen = set()
+    merged = []
+    for point in (p for points in lists for p in points):
+        point = str(point).strip()
+        key = _normalize(point)
+        if key and key not in seen:
+            seen.add(key)
+            merged.append(point)
+    return merged
+
+
+def merge_action_items(lists: List[List[Any]]) -> List[Dict[str, Any]]:
+    """Items in order, one per task (compared ignoring case and punctuation); duplicates fill missing fields."""
+    merged: Dict[str, Dict[str, Any]] = {}
+    for item in (i for items in lists for i in items):
+        if not isinstance(item, dict):
+            item = {"task": str(item)}
+        task = str(item.get("task") or "").strip()
+        key = _normalize(task)
+        if not key:
+            continue
+        if key not in merged:
+            merged[key] = {
+                "task": task,
+                "assignee": item.get("assignee"),
+                "due": item.get("due"),
+                "context": item.get("context"),
+            }
+            continue
+        existing = merged[key]
+        for field in ("assignee", "due", "context"):
+            if not existing[field] and item.get(field):
+                existing[field] = item[field]
+    return list(merged.values())
+
+
+class LLMExtractor:
+    """One extraction run: an HTTP client and a cap on concurrent requests, both bound to the running loop."""
+
+    def __init__(self, client: "httpx.AsyncClient", concurrency: int):
+        self.client = client
+        self.semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def complete(self, prompt: str) -> str:
+        async with self.semaphore:
+            if LLM_API_STYLE == "ollama":
+                response = await self.client.post("/api/chat", json={
+                    "model": LLM_MODEL,
+                    "messages": [{"role": "user", "content": prompt}],
+                    "stream": False,
+                    "format": "json",
+                    "options": {"temperature": 0.0, "num_predict": LLM_MAX_OUTPUT_TOKENS},
+                })
+                response.raise_for_status()
+                return response.json()["message"]["content"]
+            response = await self.client.post("/chat/completions", json={
+                "model": LLM_MODEL,
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": 0.0,
+                "max_tokens": LLM_MAX_OUTPUT_TOKENS,
+            })
+            response.raise_for_status()
+            return response.json()["choices"][0]["message"]["content"]
+
+    async def complete_json(self, prompt: str) -> Dict[str, Any]:
+        content = await self.complete(prompt)
+        json_text = extract_json_block(content)
+        if not json_text:
+            raise RuntimeError("LLM did not return JSON or parsing failed. Response: " + content[:1000])
+        parsed = json.loads(json_text)
+        if not isinstance(parsed, dict):
+            raise RuntimeError("LLM returned JSON that is not an object. Response: " + content[:1000])
+        return parsed
+
+    async def reduce(self, partials: List[Dict[str, Any]], budget: int) -> Dict[str, Any]:
+        """Combine partial notes in groups that fit the budget, level by level, down to one."""
+        while len(partials) > 1:
+            groups: List[List[Dict[str, Any]]] = [[]]
+            size = 0
+            for partial in partials:
+                tokens = estimate_tokens(json.dumps(partial))
+                # At least two per group, so every level shrinks
+                if len(groups[-1]) >= 2 and size + tokens > budget:
+                    groups.append([])
+                    size = 0
+                groups[-1].append(partial)
+                size += tokens
+            # A trailing group of one has nothing to combine and moves up as is
+            combined = iter(await asyncio.gather(*(
+                self.reduce_group(group) for group in groups if len(group) > 1
+            )))
+            partials = [next(combined) if len(group) > 1 else group[0] for group in groups]
+        return partials[0]
+
+    async def reduce_group(self, partials: List[Dict[str, Any]]) -> Dict[str, Any]:
+        text = "\n\n".join(
+            f"Part {i}:\n" + json.dumps({"summary": p["summary"], "key_points": p["key_points"]})
+            for i, p in enumerate(partials, 1)
+        )
+        combined = await self.complete_json(REDUCE_PROMPT.format(text=text))
+        return {
+            "summary": str(combined.get("summary") or " ".join(p["summary"] for p in partials)).strip(),
+            "key_points": merge_key_points([_as_list(combined.get("key_points"))]),
+        }
+
+
+async def extract_structured_with_llm(transcript: str) -> Dict[str, Any]:
+    """Summary, key points and action items from the configured LLM, map-reduced over transcript chunks."""
+    if not is_configured():
+        raise RuntimeError("LLM API not configured")
+
+    chunks = chunk_transcript(transcript, LLM_CHUNK_TOKENS)
+    if not chunks:
+        return {"summary": "", "key_points": [], "action_items": []}
+
+    headers = {"Authorization": f"Bearer {LLM_API_KEY}"} if LLM_API_KEY else {}
+    # A client per run, bound to the event loop that calls this
+    async with httpx.AsyncClient(base_url=LLM_BASE_URL, headers=headers, timeout=LLM_TIMEOUT_SECONDS) as client:
+        extractor = LLMExtractor(client, LLM_CONCURRENCY)
+        if len(chunks) == 1:
+            mapped = [await extractor.complete_json(SINGLE_PROMPT.format(text=chunks[0]))]
+        else:
+            logger.info("LLM extraction over %d chunks", len(chunks))
+            mapped = await asyncio.gather(*(
+                extractor.complete_json(MAP_PROMPT.format(part=i, parts=len(chunks), text=chunk))
+                for i, chunk in enumerate(chunks, 1)
+            ))
+        partials = [
+            {
+                "summary": str(m.get("summary") or "").strip(),
+                "key_points": merge_key_points([_as_list(m.get("key_points"))]),
+            }
+            for m in mapped
+        ]
+        # A single chunk's notes are already final; reduce makes no calls
+        reduced = await extractor.reduce(partials, LLM_CHUNK_TOKENS)
+
+    return {
+        "summary": reduced["summary"],
+        "key_points": reduced["key_points"],
+        "action_items": merge_action_items([_as_list(m.get("action_items")) for m in mapped]),
+    }
@@ -10,12 +10,15 @@ Features:
     - segments (optional segments with start/end timestamps)
 
 - Uses Whisper (faster-whisper or openai/whisper) to transcribe audio.
-- If OPENAI_API_KEY is provided, uses OpenAI Chat API to extract structured notes & tasks.
+- Transcripts are cached on disk by audio hash, model, language and engine, so re-running
+  extraction on the same recording skips transcription.
+- If an LLM is configured (OPENAI_API_KEY, or LLM_BASE_URL / LLM_API_STYLE=ollama for a local
+  server), extracts structured notes & tasks with it, map-reducing over chunks of long transcripts.
   Otherwise falls back to a local heuristic extractor (simple rules + regex).
 
 How to run:
 1. Create a virtualenv and install dependencies:
-   pip install fastapi uvicorn python-multipart pydantic openai
+   pip install fastapi uvicorn python-multipart pydantic httpx
    # optional (choose one):
    pip install faster-whisper
    # or
@@ -23,13 +26,21 @@ How to run:
 
 2. Export OPENAI_API_KEY if you want LLM-based extraction (recommended for best quality):
    export OPENAI_API_KEY="sk-..."
+   # or a local Ollama server:
+   export LLM_API_STYLE=ollama LLM_MODEL=llama3.1
 
 3. Start server:
    uvicorn main:app --host 0.0.0.0 --port 8000 --reload
 
 Endpoints:
 - GET /health
-- POST /transcribe  (multipart: file: audio, optional: diarize (bool), language, model)
+- GET /metrics/whisper  (resident Whisper models and load/evict counters)
+- POST /jobs  (same form fields as /transcribe; queues the work and returns a job id right away)
+- GET /jobs/{job_id}  (status, progress and, once completed, the result; kept in SQLite across restarts)
+- POST /transcribe  (multipart: file: audio, optional: diarize (bool), language, model, compute_type,
+  parallel (bool: split long recordings at silences and transcribe the pieces in worker processes))
+- POST /transcribe/stream  (same form fields; server-sent events with each segment as it is
+  transcribed, then the structured notes)
 
 Example curl:
   curl -X POST "http://localhost:8000/transcribe" -F "file=@meeting.mp3" -F "language=en" -F "diarize=false"
@@ -39,16 +50,32 @@ Notes:
 """
 
 from fastapi import FastAPI, File, UploadFile, Form, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.background import BackgroundTask
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, Callable, List, Optional, Dict, Any, Iterator, Set, Tuple
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import os
+import json
+import hashlib
+import shutil
 import tempfile
 import uuid
 import logging
-import re
 import asyncio
+import threading
+import time
+
+import llm_extract
+import parallel_transcribe
+from heuristics import heuristic_extract
+from llm_extract import extract_structured_with_llm
+from job_store import JobStore, QUEUED, RUNNING, COMPLETED, FAILED
+from transcript_cache import TranscriptCache, make_key
 
 # Optional imports for whisper
 try:
@@ -64,13 +91,6 @@ try:
 except Exception:
     HAS_OPENAI_WHISPER = False
 
-# Optional OpenAI for structured extraction
-try:
-    import openai
-    HAS_OPENAI = True
-except Exception:
-    HAS_OPENAI = False
-
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("meeting-extractor")
 
@@ -84,8 +104,57 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global: whisper model (lazy)
-_whisper_model = None
+# Whisper settings: engine ("faster", "openai", or empty to prefer faster-whisper),
+# device and default compute type, and the RAM budget for resident models
+WHISPER_ENGINE = os.getenv("WHISPER_ENGINE", "")
+WHISPER_DEVICE = os.getenv("WHISPER_DEVICE", "cpu")
+WHISPER_COMPUTE_TYPE = os.getenv("WHISPER_COMPUTE_TYPE", "int8")
+WHISPER_MEMORY_BUDGET_MB = int(os.getenv("WHISPER_MEMORY_BUDGET_MB", "4096"))
+
+# Rough resident size of each model at float32, in MB; used to stay under the budget
+WHISPER_MODEL_MB = {
+    "tiny": 150,
+    "base": 300,
+    "small": 1000,
+    "medium": 3000,
+    "large": 6000,
+}
+COMPUTE_TYPE_FACTOR = {"int8": 0.35, "int8_float16": 0.4, "float16": 0.55}
+
+# Transcriptions run one per worker thread, off the event loop; requests and
+# jobs beyond this wait in the queue
+TRANSCRIBE_WORKERS = int(os.getenv("TRANSCRIBE_WORKERS", "1"))
+
+# Job persistence: SQLite database, where job uploads wait until they run,
+# and how long finished jobs are kept
+JOBS_DB_PATH = os.getenv("JOBS_DB_PATH", "jobs/jobs.sqlite3")
+JOBS_UPLOAD_DIR = os.getenv("JOBS_UPLOAD_DIR", "jobs/uploads")
+JOB_TTL_SECONDS = float(os.getenv("JOB_TTL_SECONDS", str(7 * 24 * 3600)))
+
+# Uploads are streamed to disk in blocks of UPLOAD_CHUNK_BYTES and rejected
+# past MAX_UPLOAD_BYTES; leftover temp directories older than
+# STALE_UPLOAD_SECONDS are removed at startup
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(2 * 1024 ** 3)))
+UPLOAD_CHUNK_BYTES = int(os.getenv("UPLOAD_CHUNK_BYTES", str(1024 * 1024)))
+STALE_UPLOAD_SECONDS = float(os.getenv("STALE_UPLOAD_SECONDS", str(24 * 3600)))
+UPLOAD_DIR_PREFIX = "meet-"
+
+# Transcript cache: segments keyed by audio hash and transcription settings,
+# so retrying extraction on the same recording skips Whisper
+TRANSCRIPT_CACHE_ENABLED = os.getenv("TRANSCRIPT_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+TRANSCRIPT_CACHE_PATH = os.getenv("TRANSCRIPT_CACHE_PATH", "cache/transcripts.sqlite3")
+TRANSCRIPT_CACHE_MAX_BYTES = int(os.getenv("TRANSCRIPT_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+# Bump to invalidate cached transcripts after changing how segments are produced
+TRANSCRIPT_CACHE_VERSION = "1"
+
+# Persist job progress at most this often, in seconds
+JOB_PROGRESS_INTERVAL = 1.0
+
+transcribe_executor = ThreadPoolExecutor(max_workers=TRANSCRIBE_WORKERS, thread_name_prefix="transcribe")
+# Running jobs, referenced until they finish so they are not garbage collected
+job_tasks: Set["asyncio.Task"] = set()
+jobs = JobStore(JOBS_DB_PATH)
+transcript_cache = TranscriptCache(TRANSCRIPT_CACHE_PATH, TRANSCRIPT_CACHE_MAX_BYTES) if TRANSCRIPT_CACHE_ENABLED else None
 
 
 class ActionItem(BaseModel):
@@ -103,233 +172,311 @@ class TranscriptionResult(BaseModel):
     segments: Optional[List[Dict[str, Any]]] = None
 
 
+class JobCreated(BaseModel):
+    job_id: str
+    status: str
+
+
+class JobStatus(BaseModel):
+    job_id: str
+    status: str
+    segments_done: int = 0
+    processed_seconds: float = 0.0
+    result: Optional[TranscriptionResult] = None
+    error: Optional[str] = None
+    created_at: float
+    updated_at: float
+
+
 @app.get("/health")
 async def health():
     return {"status": "ok"}
 
 
-async def load_whisper(model_name: str = "medium"):
-    global _whisper_model
-    if _whisper_model is not None:
-        return _whisper_model
+@app.on_event("startup")
+def cleanup_uploads():
+    sweep_stale_uploads()
 
-    if HAS_FASTER_WHISPER:
-        logger.info("Loading faster-whisper model: %s", model_name)
-        # device="cpu" or "cuda"
-        model = WhisperModel(model_name, device="cpu", compute_type="int8")
-        _whisper_model = ("faster", model)
-        return _whisper_model
 
-    if HAS_OPENAI_WHISPER:
-        logger.info("Loading openai/whisper model: %s", model_name)
-        model = openai_whisper.load_model(model_name)
-        _whisper_model = ("openai", model)
-        return _whisper_model
+@app.on_event("startup")
+async def resume_jobs():
+    # Jobs interrupted by a restart run again if their upload is still there
+    for job in jobs.unfinished():
+        if os.path.exists(job["params"]["filename"]):
+            jobs.update(job["job_id"], status=QUEUED, segments_done=0, processed_seconds=0)
+            start_job(job["job_id"], job["params"])
+        else:
+            jobs.update(job["job_id"], status=FAILED, error="Upload was lost before the job finished")
+
+
+@app.on_event("shutdown")
+def shutdown_workers():
+    # Queued jobs stay queued in the database and resume on the next start
+    transcribe_executor.shutdown(wait=False, cancel_futures=True)
+    parallel_transcribe.shutdown_pool()
 
+
+@app.get("/metrics/whisper")
+async def whisper_metrics():
+    return whisper_pool.stats()
+
+
+def default_whisper_engine() -> str:
+    if WHISPER_ENGINE:
+        return WHISPER_ENGINE
+    if HAS_FASTER_WHISPER:
+        return "faster"
+    if HAS_OPENAI_WHISPER:
+        return "openai"
     raise RuntimeError("No whisper implementation available. Install faster-whisper or openai/whisper")
 
 
-async def transcribe_with_whisper_local(filepath: str, language: Optional[str] = None, model_name: str = "medium", diarize: bool = False):
-    """Transcribe audio using local whisper (faster-whisper preferred). Returns transcript and optional segments."""
-    engine_type, model = await load_whisper(model_name)
-    segments = []
-    transcript_text = ""
+def estimate_model_mb(model_name: str, compute_type: str) -> float:
+    base = next((mb for name, mb in WHISPER_MODEL_MB.items() if model_name.startswith(name)), 2000)
+    return base * COMPUTE_TYPE_FACTOR.get(compute_type, 1.0)
+
 
+def _load_model(engine: str, model_name: str, compute_type: str):
+    if engine == "faster" and HAS_FASTER_WHISPER:
+        logger.info("Loading faster-whisper model: %s (%s)", model_name, compute_type)
+        return WhisperModel(model_name, device=WHISPER_DEVICE, compute_type=compute_type)
+
+    if engine == "openai" and HAS_OPENAI_WHISPER:
+        logger.info("Loading openai/whisper model: %s", model_name)
+        return openai_whisper.load_model(model_name, device=WHISPER_DEVICE)
+
+    raise RuntimeError(f"Whisper engine '{engine}' is not available")
+
+
+class WhisperPool:
+    """
+    Loaded Whisper models keyed by (engine, model_name, compute_type).
+
+    Least recently used models are dropped once the estimated size of the
+    resident models exceeds budget_mb; a request still using an evicted model
+    keeps its own reference until it finishes. Each key has its own load lock,
+    so concurrent first requests for a model load it once while other models
+    stay available.
+    """
+
+    def __init__(self, budget_mb: int):
+        self.budget_mb = budget_mb
+        self._models: "OrderedDict[Tuple[str, str, str], Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+        self._counters = {"hits": 0, "loads": 0, "evictions": 0, "load_seconds": 0.0}
+        self._events = deque(maxlen=100)
+
+    def _lookup(self, key):
+        entry = self._models.get(key)
+        if entry is not None:
+            self._models.move_to_end(key)
+            self._counters["hits"] += 1
+            return entry[0]
+        return None
+
+    def get(self, model_name: str, engine: Optional[str] = None, compute_type: Optional[str] = None):
+        """Return (engine, model), loading it on first use. Blocking."""
+        engine = engine or default_whisper_engine()
+        compute_type = compute_type or WHISPER_COMPUTE_TYPE
+        key = (engine, model_name, compute_type)
+
+        with self._lock:
+            model = self._lookup(key)
+            if model is not None:
+                return engine, model
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                # Another request may have loaded it while we waited
+                model = self._lookup(key)
+                if model is not None:
+                    return engine, model
+
+            started = time.perf_counter()
+            model = _load_model(engine, model_name, compute_type)
+            elapsed = time.perf_counter() - started
+
+            with self._lock:
+                self._models[key] = (model, estimate_model_mb(model_name, compute_type))
+                self._counters["loads"] += 1
+                self._counters["load_seconds"] += elapsed
+                self._record("load", key, elapsed)
+                self._evict(keep=key)
+        return engine, model
+
+    def _evict(self, keep) -> None:
+        while len(self._models) > 1 and self._used_mb() > self.budget_mb:
+            key = next(k for k in self._models if k != keep)
+            del self._models[key]
+            self._counters["evictions"] += 1
+            self._record("evict", key)
+            logger.info("Evicted whisper model %s to stay under %d MB", key, self.budget_mb)
+
+    def _used_mb(self) -> float:
+        return sum(size for _, size in self._models.values())
+
+    def _record(self, event: str, key, seconds: Optional[float] = None) -> None:
+        engine, model_name, compute_type = key
+        self._events.append({
+            "event": event,
+            "engine": engine,
+            "model_name": model_name,
+            "compute_type": compute_type,
+            "seconds": round(seconds, 3) if seconds is not None else None,
+            "at": time.time(),
+        })
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "budget_mb": self.budget_mb,
+                "used_mb": round(self._used_mb(), 1),
+                "resident": [
+                    {"engine": e, "model_name": m, "compute_type": c, "estimated_mb": round(size, 1)}
+                    for (e, m, c), (_, size) in self._models.items()
+                ],
+                **self._counters,
+                "recent_events": list(self._events),
+            }
+
+
+whisper_pool = WhisperPool(WHISPER_MEMORY_BUDGET_MB)
+
+
+async def load_whisper(model_name: str = "medium", compute_type: Optional[str] = None):
+    # Loading takes seconds to minutes; keep it off the event loop
+    return await run_in_threadpool(whisper_pool.get, model_name, None, compute_type)
+
+
+def iter_segments(engine_type: str, model, filepath: str, language: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Yield segments as the model produces them. Blocking: run it off the event loop."""
     if engine_type == "faster":
-        # faster-whisper API
+        # faster-whisper decodes lazily, one segment per iteration
         segments_gen, info = model.transcribe(filepath, beam_size=5, language=language)
         for seg in segments_gen:
-            segments.append({
+            yield {
                 "start": float(seg.start),
                 "end": float(seg.end),
                 "text": seg.text.strip(),
-            })
-            transcript_text += seg.text.strip() + " "
+            }
 
     else:
-        # openai/whisper
+        # openai/whisper only returns once the whole file is done
         result = model.transcribe(filepath, language=language)
         # result['segments'] if available
         for seg in result.get("segments", []):
-            segments.append({
+            yield {
                 "start": float(seg.get("start", 0)),
                 "end": float(seg.get("end", 0)),
                 "text": seg.get("text", "").strip(),
-            })
-            transcript_text += seg.get("text", "").strip() + " "
-
-    transcript_text = transcript_text.strip()
-    return transcript_text, segments
-
-
-async def extract_structured_with_openai(transcript: str) -> Dict[str, Any]:
-    """Use OpenAI Chat API to extract summary, key points, and action items."""
-    if not HAS_OPENAI or not os.getenv("OPENAI_API_KEY"):
-        raise RuntimeError("OpenAI API not configured")
-
-    openai.api_key = os.getenv("OPENAI_API_KEY")
-
-    prompt = f"""
-You are an assistant that extracts structured meeting notes from a meeting transcript.
-Given the transcript below, produce a JSON object with fields:
-- summary: 2-4 sentence concise summary
-- key_points: array of 3-8 bullet points (short phrases)
-- action_items: array of objects with fields: task, assignee (optional), due (optional), context (optional)
-The transcript:
----
-{transcript}
----
-Return only valid JSON.
-"""
+            }
 
-    # ChatCompletion with gpt-4o or gpt-4; fall back safely
-    try:
-        response = openai.ChatCompletion.create(
-            model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.0,
-            max_tokens=700,
-        )
-        content = response["choices"][0]["message"]["content"]
-    except Exception as e:
-        # try completions
-        logger.warning("ChatCompletion failed: %s", e)
-        response = openai.Completion.create(
-            model=os.getenv("OPENAI_MODEL", "text-davinci-003"),
-            prompt=prompt,
-            temperature=0.0,
-            max_tokens=700,
-        )
-        content = response["choices"][0]["text"]
-
-    # Attempt to find JSON in content
-    json_text = extract_json_block(content)
-    if not json_text:
-        # if cannot parse, wrap in fallback
-        raise RuntimeError("OpenAI did not return JSON or parsing failed. Response: " + content[:1000])
-
-    import json
-    parsed = json.loads(json_text)
-    return parsed
-
-
-def extract_json_block(text: str) -> Optional[str]:
-    """Extract the first JSON object or array from a string."""
-    # naive approach: find first { and last matching }
-    start = text.find("{")
-    end = text.rfind("}")
-    if start != -1 and end != -1 and end > start:
-        return text[start:end+1]
-    # try array
-    start = text.find("[")
-    end = text.rfind("]")
-    if start != -1 and end != -1 and end > start:
-        return text[start:end+1]
-    return None
-
-
-def heuristic_extract(transcript: str) -> Dict[str, Any]:
-    """A simple rule-based extractor for summary, key points and action items."""
-    # split into sentences (very naive)
-    sentences = re.split(r"(?<=[.!?])\s+", transcript)
-    # summary: first 2 sentences (fallback)
-    summary = " ".join(sentences[:2]).strip()
-
-    # key points: pick sentences that are short and contain keywords or are likely important
-    keywords = ["decide", "decided", "decision", "plan", "problem", "risk", "next", "update", "deadline"]
-    key_points = []
-    for s in sentences:
-        sl = s.lower()
-        if len(s) < 250 and any(k in sl for k in keywords):
-            key_points.append(s.strip())
-    # if none found, pick top 4 non-empty sentences
-    if not key_points:
-        key_points = [s.strip() for s in sentences if s.strip()][:4]
-
-    # action items: find lines with 'action', 'todo', 'follow up', or imperatives + names
-    action_patterns = [r"todo[:\-]?\s*(.*)", r"action[:\-]?\s*(.*)", r"follow up with (.*?)[:\-]?(.*)", r"(?i)(assign|will|we will|please|please\s+check)\s+(.*)"]
-    action_items = []
-    for s in sentences:
-        for pat in action_patterns:
-            m = re.search(pat, s, flags=re.IGNORECASE)
-            if m:
-                # build a simple task
-                task_text = (m.group(1) if m.groups() else s).strip()
-                if not task_text:
-                    task_text = s.strip()
-                # try to infer assignee by looking for capitalized names or patterns
-                assignee = None
-                name_m = re.search(r"([A-Z][a-z]+)\s*(?:will|to|:\s)", s)
-                if name_m:
-                    assignee = name_m.group(1)
-                action_items.append({"task": task_text, "assignee": assignee, "due": None, "context": s.strip()})
-
-    # also look for lines like "Alice: I'll take X"
-    for s in sentences:
-        colon = s.split(":", 1)
-        if len(colon) == 2 and len(colon[0].split()) <= 3:  # likely a speaker
-            speaker = colon[0].strip()
-            body = colon[1].strip()
-            if re.search(r"(I'll|I will|I'll take|I'll do|I will take|assign|take care|action)", body, flags=re.IGNORECASE):
-                action_items.append({"task": body, "assignee": speaker, "due": None, "context": s.strip()})
-
-    # dedupe
-    seen = set()
-    unique_actions = []
-    for a in action_items:
-        key = a["task"]
-        if key not in seen:
-            seen.add(key)
-            unique_actions.append(a)
-
-    # format
-    action_items = unique_actions
-
-    return {
-        "summary": summary,
-        "key_points": key_points,
-        "action_items": action_items,
-    }
 
+def join_segments(segments: List[Dict[str, Any]]) -> str:
+    return "".join(seg["text"] + " " for seg in segments).strip()
 
-@app.post("/transcribe", response_model=TranscriptionResult)
-async def transcribe_endpoint(
-    file: UploadFile = File(...),
-    language: Optional[str] = Form(None),
-    diarize: Optional[bool] = Form(False),
-    model_name: Optional[str] = Form("medium"),
-    use_llm: Optional[bool] = Form(True),
-):
-    # save uploaded file
-    if not file.filename:
-        raise HTTPException(status_code=400, detail="No file uploaded")
 
-    suffix = os.path.splitext(file.filename)[1]
-    tmpdir = tempfile.mkdtemp(prefix="meet-")
-    filename = os.path.join(tmpdir, f"{uuid.uuid4().hex}{suffix}")
+def iter_segments_parallel(filepath: str, language: Optional[str], model_name: str, compute_type: Optional[str]) -> Iterator[Dict[str, Any]]:
+    return parallel_transcribe.iter_segments_parallel(
+        filepath, model_name, compute_type or WHISPER_COMPUTE_TYPE, language
+    )
 
-    with open(filename, "wb") as f:
-        content = await file.read()
-        f.write(content)
 
-    logger.info("Saved uploaded file to %s", filename)
+def transcript_cache_key(audio_hash: Optional[str], language: Optional[str], model_name: str, compute_type: Optional[str], parallel: bool) -> Optional[str]:
+    if not audio_hash or transcript_cache is None:
+        return None
+    return make_key(
+        "transcript",
+        audio_hash,
+        "faster" if parallel else default_whisper_engine(),
+        model_name,
+        compute_type or WHISPER_COMPUTE_TYPE,
+        language or "auto",
+        "parallel" if parallel else "sequential",
+        TRANSCRIPT_CACHE_VERSION,
+    )
 
-    try:
-        transcript, segments = await transcribe_with_whisper_local(filename, language=language, model_name=model_name, diarize=diarize)
-    except Exception as e:
-        logger.exception("Transcription failed")
-        raise HTTPException(status_code=500, detail=str(e))
 
+def caching_segments(key: str, segment_iter: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Pass segments through and cache the full list once the transcription completes."""
+    segments = []
+    for seg in segment_iter:
+        segments.append(seg)
+        yield seg
+    transcript_cache.put(key, segments)
+
+
+def open_segments(
+    filepath: str,
+    language: Optional[str] = None,
+    model_name: str = "medium",
+    compute_type: Optional[str] = None,
+    parallel: bool = False,
+    audio_hash: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Segment iterator for a file: served from the transcript cache when
+    audio_hash and the settings match an earlier run, otherwise transcribed
+    (and cached when audio_hash is given). Blocking: it may load a model.
+    """
+    key = transcript_cache_key(audio_hash, language, model_name, compute_type, parallel)
+    cached = transcript_cache.get(key) if key else None
+    if cached is not None:
+        logger.info("Transcript cache hit for %s", filepath)
+        return iter(cached)
+
+    if parallel:
+        segment_iter = iter_segments_parallel(filepath, language, model_name, compute_type)
+    else:
+        engine_type, model = whisper_pool.get(model_name, None, compute_type)
+        segment_iter = iter_segments(engine_type, model, filepath, language)
+    return caching_segments(key, segment_iter) if key else segment_iter
+
+
+def transcribe_segments(
+    filepath: str,
+    language: Optional[str] = None,
+    model_name: str = "medium",
+    compute_type: Optional[str] = None,
+    parallel: bool = False,
+    on_segment: Optional[Callable[[Dict[str, Any], int], None]] = None,
+    audio_hash: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Transcribe a file and return its segments; on_segment(segment, count) reports progress. Blocking."""
+    segment_iter = open_segments(filepath, language, model_name, compute_type, parallel, audio_hash)
+
+    segments = []
+    for seg in segment_iter:
+        segments.append(seg)
+        if on_segment:
+            on_segment(seg, len(segments))
+    return segments
+
+
+async def transcribe_with_whisper_local(filepath: str, language: Optional[str] = None, model_name: str = "medium", diarize: bool = False, compute_type: Optional[str] = None, parallel: bool = False, audio_hash: Optional[str] = None):
+    """Transcribe audio using local whisper (faster-whisper preferred). Returns transcript and optional segments."""
+    # Runs in the bounded transcription executor so the event loop stays free
+    segments = await asyncio.get_running_loop().run_in_executor(
+        transcribe_executor,
+        partial(transcribe_segments, filepath, language, model_name, compute_type, parallel, audio_hash=audio_hash),
+    )
+    return join_segments(segments), segments
+
+
+async def build_result(transcript: str, segments: List[Dict[str, Any]], use_llm: bool) -> TranscriptionResult:
+    """Extract notes and action items from a transcript and assemble the response."""
     # Post-process: use LLM if configured and requested
     structured = None
-    if use_llm and HAS_OPENAI and os.getenv("OPENAI_API_KEY"):
+    if use_llm and llm_extract.is_configured():
         try:
-            structured = await extract_structured_with_openai(transcript)
+            structured = await extract_structured_with_llm(transcript)
         except Exception as e:
-            logger.warning("OpenAI extraction failed: %s", e)
-            structured = heuristic_extract(transcript)
+            logger.warning("LLM extraction failed: %s", e)
+            structured = await run_in_threadpool(heuristic_extract, transcript)
     else:
-        structured = heuristic_extract(transcript)
+        structured = await run_in_threadpool(heuristic_extract, transcript)
 
     # Build response
     action_items_parsed = []
@@ -346,7 +493,7 @@ async def transcribe_endpoint(
     if isinstance(key_points, str):
         key_points = [key_points]
 
-    result = TranscriptionResult(
+    return TranscriptionResult(
         transcript=transcript,
         summary=structured.get("summary", ""),
         key_points=key_points,
@@ -354,15 +501,300 @@ async def transcribe_endpoint(
         segments=segments,
     )
 
-    # cleanup file (optional)
+
+async def save_upload(file: UploadFile, directory: Optional[str] = None, with_hash: bool = False) -> Tuple[str, Optional[str]]:
+    """
+    Stream the upload in UPLOAD_CHUNK_BYTES blocks to a file in a new directory
+    of its own (created under directory if given). Returns the path and, with
+    with_hash, the SHA-256 of the content computed along the way.
+    Uploads over MAX_UPLOAD_BYTES are rejected with 413.
+    """
+    if not file.filename:
+        raise HTTPException(status_code=400, detail="No file uploaded")
+
+    suffix = os.path.splitext(file.filename)[1]
+    tmpdir = tempfile.mkdtemp(prefix=UPLOAD_DIR_PREFIX, dir=directory)
+    filename = os.path.join(tmpdir, f"{uuid.uuid4().hex}{suffix}")
+    digest = hashlib.sha256() if with_hash else None
+    size = 0
+
+    try:
+        with open(filename, "wb") as f:
+            while True:
+                block = await file.read(UPLOAD_CHUNK_BYTES)
+                if not block:
+                    break
+                size += len(block)
+                if size > MAX_UPLOAD_BYTES:
+                    raise HTTPException(status_code=413, detail=f"Upload exceeds {MAX_UPLOAD_BYTES} bytes")
+                if digest is not None:
+                    digest.update(block)
+                f.write(block)
+    except BaseException:
+        remove_upload(filename)
+        raise
+
+    logger.info("Saved uploaded file to %s (%d bytes)", filename, size)
+    return filename, digest.hexdigest() if digest is not None else None
+
+
+def remove_upload(filename: str) -> None:
+    """Delete an upload together with the directory save_upload made for it."""
+    shutil.rmtree(os.path.dirname(filename), ignore_errors=True)
+
+
+def sweep_stale_uploads() -> None:
+    """Remove temp upload directories left behind by a crash or kill."""
+    tmp_root = tempfile.gettempdir()
+    cutoff = time.time() - STALE_UPLOAD_SECONDS
+    for name in os.listdir(tmp_root):
+        path = os.path.join(tmp_root, name)
+        try:
+            if name.startswith(UPLOAD_DIR_PREFIX) and os.path.isdir(path) and os.path.getmtime(path) < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+        except OSError:
+            pass
+
+
+@app.post("/transcribe", response_model=TranscriptionResult)
+async def transcribe_endpoint(
+    file: UploadFile = File(...),
+    language: Optional[str] = Form(None),
+    diarize: Optional[bool] = Form(False),
+    model_name: Optional[str] = Form("medium"),
+    use_llm: Optional[bool] = Form(True),
+    compute_type: Optional[str] = Form(None),
+    parallel: Optional[bool] = Form(False),
+):
+    # save uploaded file
+    filename, audio_hash = await save_upload(file, with_hash=TRANSCRIPT_CACHE_ENABLED)
+
     try:
-        os.remove(filename)
-    except Exception:
-        pass
+        try:
+            transcript, segments = await transcribe_with_whisper_local(filename, language=language, model_name=model_name, diarize=diarize, compute_type=compute_type, parallel=parallel, audio_hash=audio_hash)
+        except Exception as e:
+            logger.exception("Transcription failed")
+            raise HTTPException(status_code=500, detail=str(e))
+
+        result = await build_result(transcript, segments, use_llm)
+    finally:
+        remove_upload(filename)
 
     return JSONResponse(content=result.dict())
 
 
+def transcribe_job(job_id: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Transcription step of a job, run in the transcription executor; persists progress."""
+    jobs.update(job_id, status=RUNNING)
+    last_write = 0.0
+
+    def on_segment(seg: Dict[str, Any], count: int) -> None:
+        nonlocal last_write
+        now = time.monotonic()
+        if now - last_write >= JOB_PROGRESS_INTERVAL:
+            last_write = now
+            jobs.update(job_id, segments_done=count, processed_seconds=seg["end"])
+
+    return transcribe_segments(
+        params["filename"],
+        params["language"],
+        params["model_name"],
+        params["compute_type"],
+        params["parallel"],
+        on_segment=on_segment,
+        audio_hash=params.get("audio_hash"),
+    )
+
+
+async def run_job(job_id: str, params: Dict[str, Any]) -> None:
+    """Run a queued job and persist the result."""
+    # Only transcription holds a transcription worker; extraction, which may
+    # be a slow LLM map-reduce, runs on the event loop
+    try:
+        segments = await asyncio.get_running_loop().run_in_executor(
+            transcribe_executor, transcribe_job, job_id, params
+        )
+        result = await build_result(join_segments(segments), segments, params["use_llm"])
+        jobs.update(
+            job_id,
+            status=COMPLETED,
+            segments_done=len(segments),
+            processed_seconds=segments[-1]["end"] if segments else 0.0,
+            result=result.dict(),
+        )
+    except Exception as e:
+        logger.exception("Transcription job %s failed", job_id)
+        jobs.update(job_id, status=FAILED, error=str(e))
+    # Not reached when the task is cancelled at shutdown: the upload stays
+    # for the job to resume on the next start
+    remove_upload(params["filename"])
+
+
+def start_job(job_id: str, params: Dict[str, Any]) -> None:
+    task = asyncio.get_running_loop().create_task(run_job(job_id, params))
+    job_tasks.add(task)
+    task.add_done_callback(job_tasks.discard)
+
+
+@app.post("/jobs", response_model=JobCreated, status_code=202)
+async def create_job(
+    file: UploadFile = File(...),
+    language: Optional[str] = Form(None),
+    diarize: Optional[bool] = Form(False),
+    model_name: Optional[str] = Form("medium"),
+    use_llm: Optional[bool] = Form(True),
+    compute_type: Optional[str] = Form(None),
+    parallel: Optional[bool] = Form(False),
+):
+    os.makedirs(JOBS_UPLOAD_DIR, exist_ok=True)
+    filename, audio_hash = await save_upload(file, JOBS_UPLOAD_DIR, with_hash=TRANSCRIPT_CACHE_ENABLED)
+
+    job_id = uuid.uuid4().hex
+    params = {
+        "filename": filename,
+        "language": language,
+        "model_name": model_name,
+        "compute_type": compute_type,
+        "parallel": parallel,
+        "use_llm": use_llm,
+        "audio_hash": audio_hash,
+    }
+    jobs.prune(JOB_TTL_SECONDS)
+    jobs.create(job_id, params)
+    start_job(job_id, params)
+    return JobCreated(job_id=job_id, status=QUEUED)
+
+
+@app.get("/jobs/{job_id}", response_model=JobStatus)
+async def get_job(job_id: str):
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    job.pop("params")
+    return JobStatus(**job)
+
+
+class SegmentStream:
+    """
+    Segments of one streamed transcription, produced by a single transcription
+    executor call that holds its worker until the iterator is drained or the
+    stream is closed, so queued requests cannot take the slot between segments.
+    """
+
+    _OPENED = object()
+    _DONE = object()
+
+    def __init__(self, open_iter: Callable[[], Iterator[Dict[str, Any]]]):
+        self._loop = asyncio.get_running_loop()
+        self._queue: "asyncio.Queue[Any]" = asyncio.Queue()
+        self._closed = threading.Event()
+        self._loop.run_in_executor(transcribe_executor, self._run, open_iter)
+
+    def _put(self, item: Any) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, item)
+        except RuntimeError:
+            # The event loop is gone (shutdown); nobody is listening
+            self._closed.set()
+
+    def _run(self, open_iter: Callable[[], Iterator[Dict[str, Any]]]) -> None:
+        segment_iter = None
+        try:
+            segment_iter = open_iter()
+            self._put(self._OPENED)
+            for seg in segment_iter:
+                if self._closed.is_set():
+                    break
+                self._put(seg)
+            self._put(self._DONE)
+        except Exception as e:
+            self._put(e)
+        finally:
+            # Stops a cache-filling generator without storing a partial transcript
+            close = getattr(segment_iter, "close", None)
+            if close:
+                close()
+
+    async def _get(self) -> Any:
+        item = await self._queue.get()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    async def opened(self) -> None:
+        """Wait until the iterator is open; raises if opening it (e.g. loading the model) failed."""
+        await self._get()
+
+    async def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        while True:
+            seg = await self._get()
+            if seg is self._DONE:
+                return
+            yield seg
+
+    def close(self) -> None:
+        """Release the worker after its current segment."""
+        self._closed.set()
+
+
+def sse_event(payload: Dict[str, Any]) -> str:
+    return f"data: {json.dumps(payload)}\n\n"
+
+
+def end_stream(stream: SegmentStream, filename: str) -> None:
+    stream.close()
+    remove_upload(filename)
+
+
+async def transcription_events(filename: str, stream: SegmentStream, use_llm: bool):
+    """Server-sent events: one per segment as Whisper yields it, then the full result with "done"."""
+    segments = []
+    try:
+        # The stream holds one of the TRANSCRIBE_WORKERS until Whisper is done;
+        # extraction below runs after the worker is released
+        async for seg in stream:
+            segments.append(seg)
+            yield sse_event({"index": len(segments) - 1, "segment": seg})
+
+        result = await build_result(join_segments(segments), segments, use_llm)
+        yield sse_event(dict(result.dict(), done=True))
+    except Exception as e:
+        logger.exception("Streaming transcription failed")
+        yield sse_event({"error": str(e)})
+    finally:
+        end_stream(stream, filename)
+
+
+@app.post("/transcribe/stream")
+async def transcribe_stream_endpoint(
+    file: UploadFile = File(...),
+    language: Optional[str] = Form(None),
+    diarize: Optional[bool] = Form(False),
+    model_name: Optional[str] = Form("medium"),
+    use_llm: Optional[bool] = Form(True),
+    compute_type: Optional[str] = Form(None),
+    parallel: Optional[bool] = Form(False),
+):
+    filename, audio_hash = await save_upload(file, with_hash=TRANSCRIPT_CACHE_ENABLED)
+
+    # Opening may load a model; cached transcripts are replayed without one
+    stream = SegmentStream(partial(open_segments, filename, language, model_name, compute_type, parallel, audio_hash))
+    try:
+        await stream.opened()
+    except Exception as e:
+        logger.exception("Loading whisper failed")
+        remove_upload(filename)
+        raise HTTPException(status_code=500, detail=str(e))
+
+    # The generator cleans up when it ends; the background task covers a
+    # client that disconnects before the stream starts
+    return StreamingResponse(
+        transcription_events(filename, stream, use_llm),
+        media_type="text/event-stream",
+        background=BackgroundTask(end_stream, stream, filename),
+    )
+
+
 # If run as script
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,175 @@
+"""
+Parallel transcription of long recordings.
+
+The audio is decoded once, cut at silences found by voice-activity detection
+into windows of roughly WINDOW_MIN_SECONDS to WINDOW_MAX_SECONDS, and the
+windows are transcribed in a pool of worker processes, each with its own
+faster-whisper model. Segment timestamps are shifted back onto the original
+timeline and yielded in order.
+
+Kept apart from main.py so worker processes do not import the web app.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from faster_whisper import WhisperModel, decode_audio
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+    HAS_FASTER_WHISPER = True
+except Exception:
+    HAS_FASTER_WHISPER = False
+
+logger = logging.getLogger("meeting-extractor")
+
+SAMPLE_RATE = 16000
+
+# Worker processes (each loads its own model) and target window length
+PARALLEL_WORKERS = int(os.getenv("PARALLEL_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+WINDOW_MIN_SECONDS = float(os.getenv("WINDOW_MIN_SECONDS", "30"))
+WINDOW_MAX_SECONDS = float(os.getenv("WINDOW_MAX_SECONDS", "60"))
+
+# Silences shorter than this are not treated as cut points
+VAD_MIN_SILENCE_MS = int(os.getenv("VAD_MIN_SILENCE_MS", "500"))
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+# Per worker process: the model for the most recent (model_name, compute_type)
+_worker_models: Dict[Tuple[str, str], Any] = {}
+_worker_threads = 1
+
+
+def _init_worker(threads: int) -> None:
+    global _worker_threads
+    _worker_threads = threads
+
+
+def _get_worker_model(model_name: str, compute_type: str):
+    key = (model_name, compute_type)
+    if key not in _worker_models:
+        # One model per worker keeps memory at workers x model size
+        _worker_models.clear()
+        _worker_models[key] = WhisperModel(
+            model_name, device="cpu", compute_type=compute_type, cpu_threads=_worker_threads
+        )
+    return _worker_models[key]
+
+
+def _transcribe_window(audio, offset: float, model_name: str, compute_type: str, language: Optional[str]):
+    """Transcribe one window; returns (segments on the original timeline, detected language)."""
+    model = _get_worker_model(model_name, compute_type)
+    segments, info = model.transcribe(audio, beam_size=5, language=language)
+    return [
+        {
+            "start": float(seg.start) + offset,
+            "end": float(seg.end) + offset,
+            "text": seg.text.strip(),
+        }
+        for seg in segments
+    ], info.language
+
+
+def get_pool(workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Return the shared worker pool. Passing a different worker count replaces it."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None and workers in (None, _pool_workers):
+            return _pool
+        if _pool is not None:
+            _pool.shutdown()
+
+        workers = workers or PARALLEL_WORKERS
+        # spawn, not fork: forked CTranslate2/OpenMP thread pools can deadlock
+        _pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(max(1, (os.cpu_count() or 1) // workers),),
+        )
+        _pool_workers = workers
+        return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+        _pool, _pool_workers = None, 0
+
+
+def plan_windows(speech: List[Dict[str, int]], total: int, sample_rate: int = SAMPLE_RATE) -> List[Tuple[int, int]]:
+    """
+    Group speech regions (sample offsets) into windows that end at a silence
+    once they reach the minimum length and never exceed the maximum, except
+    where a single region is longer than that and has to be cut mid-speech.
+    Windows are contiguous: each cut sits in the middle of a silence.
+    """
+    min_len = int(WINDOW_MIN_SECONDS * sample_rate)
+    max_len = int(WINDOW_MAX_SECONDS * sample_rate)
+
+    cuts = []
+    window_start = 0
+    previous_end = None
+    for region in speech:
+        start, end = region["start"], region["end"]
+        if previous_end is not None:
+            gap_middle = (previous_end + start) // 2
+            # Cut in this silence if the window is long enough, or if the
+            # next region would overflow it
+            if gap_middle - window_start >= min_len or end - window_start > max_len:
+                cuts.append(gap_middle)
+                window_start = gap_middle
+        while end - window_start > max_len:
+            window_start += max_len
+            cuts.append(window_start)
+        previous_end = end
+
+    bounds = [0] + cuts + [total]
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def speech_regions(audio) -> List[Dict[str, int]]:
+    return get_speech_timestamps(audio, VadOptions(min_silence_duration_ms=VAD_MIN_SILENCE_MS))
+
+
+def iter_segments_parallel(
+    filepath: str,
+    model_name: str = "medium",
+    compute_type: str = "int8",
+    language: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield the recording's segments in order, transcribing windows in parallel. Blocking."""
+    if not HAS_FASTER_WHISPER:
+        raise RuntimeError("Parallel transcription needs faster-whisper")
+
+    audio = decode_audio(filepath, sampling_rate=SAMPLE_RATE)
+    windows = plan_windows(speech_regions(audio), len(audio))
+    logger.info("Transcribing %d windows of %s in parallel", len(windows), filepath)
+    pool = get_pool(workers)
+
+    def submit(start: int, end: int, lang: Optional[str]):
+        return pool.submit(
+            _transcribe_window, audio[start:end], start / SAMPLE_RATE, model_name, compute_type, lang
+        )
+
+    futures = [submit(*windows[0], language)] if windows else []
+    if language is None and windows:
+        # Detect the language once so every window is decoded the same way
+        _, language = futures[0].result()
+    futures += [submit(start, end, language) for start, end in windows[1:]]
+
+    try:
+        for future in futures:
+            segments, _ = future.result()
+            yield from segments
+    finally:
+        for future in futures:
+            future.cancel()
@@ -1,8 +1,55 @@
 # streamlit_app.py
+import json
+
 import streamlit as st
 import requests
 
 API_URL = "http://localhost:8000/transcribe"
+STREAM_URL = f"{API_URL}/stream"
+
+
+def stream_events(files, data):
+    """Yield the JSON events of the backend's server-sent event stream."""
+    with requests.post(STREAM_URL, files=files, data=data, stream=True, timeout=3600) as response:
+        if response.status_code != 200:
+            yield {"error": f"Error {response.status_code}: {response.text}"}
+            return
+        for line in response.iter_lines():
+            if not line:
+                continue
+            line_str = line.decode("utf-8")
+            if not line_str.startswith("data: "):
+                continue
+            try:
+                yield json.loads(line_str[6:])
+            except json.JSONDecodeError:
+                continue
+
+
+def render_result(result):
+    st.subheader("📝 Transcript")
+    st.write(result["transcript"])
+
+    st.subheader("📌 Summary")
+    st.write(result["summary"])
+
+    st.subheader("🔑 Key Points")
+    for kp in result["key_points"]:
+        st.markdown(f"- {kp}")
+
+    st.subheader("✅ Action Items")
+    if result["action_items"]:
+        for ai in result["action_items"]:
+            st.markdown(
+                f"- **Task**: {ai['task']} "
+                f"{'(Assignee: ' + ai['assignee'] + ')' if ai['assignee'] else ''} "
+                f"{'(Due: ' + ai['due'] + ')' if ai['due'] else ''}"
+            )
+            if ai.get("context"):
+                st.caption(ai["context"])
+    else:
+        st.write("No action items found.")
+
 
 st.set_page_config(page_title="Meeting Notes & Action Items", layout="wide")
 
@@ -14,50 +61,38 @@ uploaded_file = st.file_uploader("Upload a meeting audio file", type=["mp3", "wa
 language = st.selectbox("Language", ["auto", "en", "hi", "fr", "de"])
 model_name = st.selectbox("Model", ["tiny", "base", "small", "medium", "large"])
 use_llm = st.checkbox("Use LLM for extraction", value=True)
+parallel = st.checkbox("Parallel transcription (faster for long recordings)", value=False)
 
 if uploaded_file is not None:
     if st.button("Transcribe & Extract"):
-        with st.spinner("Processing..."):
-            files = {
-                "file": (uploaded_file.name, uploaded_file, "audio/mpeg"),
-            }
-            data = {
-                "language": None if language == "auto" else language,
-                "diarize": "false",
-                "model_name": model_name,
-                "use_llm": str(use_llm).lower(),
-            }
-
-            response = requests.post(API_URL, files=files, data=data)
-
-            if response.status_code == 200:
-                result = response.json()
-
-                st.subheader("📝 Transcript")
-                st.write(result["transcript"])
-
-                st.subheader("📌 Summary")
-                st.write(result["summary"])
-
-                st.subheader("🔑 Key Points")
-                for kp in result["key_points"]:
-                    st.markdown(f"- {kp}")
-
-                st.subheader("✅ Action Items")
-                if result["action_items"]:
-                    for ai in result["action_items"]:
-                        st.markdown(
-                            f"- **Task**: {ai['task']} "
-                            f"{'(Assignee: ' + ai['assignee'] + ')' if ai['assignee'] else ''} "
-                            f"{'(Due: ' + ai['due'] + ')' if ai['due'] else ''}"
-                        )
-                        if ai.get("context"):
-                            st.caption(ai["context"])
-                else:
-                    st.write("No action items found.")
-
-                st.subheader("⏱️ Segments")
-                for seg in result.get("segments", []):
-                    st.markdown(f"[{seg['start']}s → {seg['end']}s] {seg['text']}")
-            else:
-                st.error(f"Error {response.status_code}: {response.text}")
+        files = {
+            "file": (uploaded_file.name, uploaded_file, "audio/mpeg"),
+        }
+        data = {
+            "language": None if language == "auto" else language,
+            "diarize": "false",
+            "model_name": model_name,
+            "use_llm": str(use_llm).lower(),
+            "parallel": str(parallel).lower(),
+        }
+
+        # Segments appear as soon as Whisper produces them
+        st.subheader("⏱️ Segments")
+        status = st.empty()
+        segment_list = st.container(height=400)
+        status.info("Transcribing...")
+
+        try:
+            for event in stream_events(files, data):
+                if "error" in event:
+                    status.error(event["error"])
+                    break
+                if event.get("done"):
+                    status.empty()
+                    render_result(event)
+                    break
+                seg = event["segment"]
+                segment_list.markdown(f"[{seg['start']}s → {seg['end']}s] {seg['text']}")
+                status.info(f"Transcribing... {seg['end']:.0f}s of audio processed")
+        except requests.exceptions.RequestException as e:
+            status.error(f"Error connecting to the backend: {e}")
@@ -1,27 +1,50 @@
 from fastapi import APIRouter, Form, UploadFile, File
-from app.services.ollama_service import get_ollama_response
+from fastapi.responses import StreamingResponse
+from app.services.ollama_service import get_ollama_response, stream_ollama_response
 from app.services.chat_history_service import get_chat_history, save_chat_history
 from app.core import config, constants
 import base64
+import json
 
 router = APIRouter()
 
 @router.post(constants.CHAT_ROUTE_URL)
-async def chat_with_ollama(prompt: str = Form(...), image: UploadFile = File(None)):
+async def chat_with_ollama(prompt: str = Form(...), image: UploadFile = File(None), stream: bool = Form(False)):
     model = config.OLLAMA_MODEL
-    
+
     history = get_chat_history()
     history.append({"role": "user", "content": prompt})
     print("Prompt: "+prompt)
-    
+
     image_b64 = None
     if image:
         contents = await image.read()
         image_b64 = base64.b64encode(contents).decode("utf-8")
-    
+
+    if stream:
+        return StreamingResponse(
+            stream_chat(model, history, prompt, image_b64),
+            media_type=constants.STREAM_MEDIA_TYPE,
+        )
+
     response = await get_ollama_response(model, history, prompt, image=image_b64)
-    
+
     history.append({"role": "assistant", "content": response["response"]})
     save_chat_history(history)
-    
-    return response
\ No newline at end of file
+
+    return response
+
+async def stream_chat(model: str, history: list, prompt: str, image: str = None):
+    parts = []
+    try:
+        async for chunk in stream_ollama_response(model, prompt, image=image):
+            parts.append(chunk)
+            yield f"data: {json.dumps({'chunk': chunk})}\n\n"
+    except Exception as e:
+        print("Exception occured while streaming ollama response: "+str(e))
+        yield f"data: {json.dumps({'error': constants.INTERNAL_SERVER_ERROR})}\n\n"
+        return
+
+    history.append({"role": "assistant", "content": "".join(parts)})
+    save_chat_history(history)
+    yield f"data: {json.dumps({'done': True})}\n\n"
@@ -8,4 +8,5 @@ OLLAMA_STREAM = False
 CHAT_ROUTE_URL = "/chat"
 CHAT_HISTORY_FILE = "chat_history.json"
 CLEAR_CHAT_ROUTE_URL = "/clear-chat"
-GET_CHAT_HISTORY_ROUTE_URL = "/chat-history"
\ No newline at end of file
+GET_CHAT_HISTORY_ROUTE_URL = "/chat-history"
+STREAM_MEDIA_TYPE = "text/event-stream"
\ No newline at end of file
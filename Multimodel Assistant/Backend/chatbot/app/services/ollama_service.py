@@ -1,3 +1,4 @@
+import json
 import httpx
 from app.core.config import OLLAMA_URL
 from app.core.constants import INTERNAL_SERVER_ERROR, TIME_OUT_OLLAMA_MSSG, OLLAMA_TIME_OUT, MODEL, OLLAMA_STREAM, STREAM, PROMPT
@@ -20,3 +21,27 @@ async def get_ollama_response(model: str, messages: list, prompt: str, image: st
     except Exception as e:
         print("Exception occured at get ollama response service: "+str(e))
         return {INTERNAL_SERVER_ERROR}
+
+async def stream_ollama_response(model: str, prompt: str, image: str = None):
+    """Yields response fragments from Ollama as they are generated."""
+    payload = {MODEL: model, PROMPT: prompt, STREAM: True}
+    if image:
+        payload["images"] = [image]
+    async with httpx.AsyncClient(timeout=OLLAMA_TIME_OUT) as client:
+        async with client.stream("POST", OLLAMA_URL, json=payload) as response:
+            # Errors such as an unknown model come back as a non-2xx status
+            # or as an {"error": ...} line
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if data.get("error"):
+                    raise RuntimeError(data["error"])
+                if data.get("response"):
+                    yield data["response"]
+                if data.get("done"):
+                    break
@@ -1,9 +1,74 @@
+import io
+import json
+
 import streamlit as st
 import requests
+from PIL import Image, ImageOps
 
 # API endpoint
 API_URL = "http://localhost:8000/chat"
 
+# Longest image side sent to the backend; LLaVA resizes internally, so
+# anything larger only costs upload bandwidth.
+MAX_IMAGE_SIDE = 1024
+JPEG_QUALITY = 85
+
+
+@st.cache_resource
+def get_session():
+    """Shared HTTP session so reruns reuse pooled connections."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def prepare_image(uploaded_file):
+    """Downscales the image and re-encodes it as JPEG before upload."""
+    image = Image.open(uploaded_file)
+    # Apply the EXIF orientation, which is lost on re-encoding, so phone
+    # photos are not sent rotated
+    image = ImageOps.exif_transpose(image)
+    image.thumbnail((MAX_IMAGE_SIDE, MAX_IMAGE_SIDE))
+    if image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=JPEG_QUALITY, optimize=True)
+    buffer.seek(0)
+    name = uploaded_file.name.rsplit(".", 1)[0] + ".jpg"
+    return name, buffer
+
+
+def stream_response(files, data):
+    """Yields answer fragments from the backend's event stream."""
+    # The with block returns the connection to the session's pool even when
+    # we stop reading early
+    with get_session().post(API_URL, files=files, data=data, stream=True, timeout=300) as response:
+        if response.status_code != 200:
+            yield f"Error {response.status_code}: {response.text}"
+            return
+
+        for line in response.iter_lines():
+            if not line:
+                continue
+            line_str = line.decode("utf-8")
+            if not line_str.startswith("data: "):
+                continue
+            try:
+                event = json.loads(line_str[6:])
+            except json.JSONDecodeError:
+                continue
+            if "chunk" in event:
+                yield event["chunk"]
+            if "error" in event:
+                yield f"\n\n❌ {event['error']}"
+                break
+            if event.get("done"):
+                break
+
+
 st.title("📸 LLaVA Image Chat")
 st.write("Ask questions about an image using LLaVA.")
 
@@ -13,23 +78,22 @@ uploaded_file = st.file_uploader("Upload an image", type=["jpg", "jpeg", "png"])
 
 if st.button("Ask"):
     if uploaded_file and prompt:
+        name, image_bytes = prepare_image(uploaded_file)
+
         # Prepare multipart form data
         files = {
-            "image": (uploaded_file.name, uploaded_file, uploaded_file.type)
+            "image": (name, image_bytes, "image/jpeg")
         }
         data = {
-            "prompt": prompt
+            "prompt": prompt,
+            "stream": "true",
         }
 
-        with st.spinner("🔍 Analyzing image..."):
-            response = requests.post(API_URL, files=files, data=data)
-
-        if response.status_code == 200:
-            result = response.json()
-            st.image(uploaded_file, caption="Uploaded Image", use_column_width=True)
-            st.subheader("Response:")
-            st.write(result.get("response", "No response"))
-        else:
-            st.error(f"Error {response.status_code}: {response.text}")
+        st.image(uploaded_file, caption="Uploaded Image", use_column_width=True)
+        st.subheader("Response:")
+        try:
+            st.write_stream(stream_response(files, data))
+        except requests.exceptions.RequestException as e:
+            st.error(f"Error connecting to the backend: {e}")
     else:
-        st.warning("Please upload an image and enter a prompt.")
\ No newline at end of file
+        st.warning("Please upload an image and enter a prompt.")